@@ -0,0 +1,5 @@
+from api._common import get_app_server
+
+# Import src/server.py as soon as the package loads so every handler module
+# shares the one instance instead of paying for it on its first request.
+get_app_server()
@@ -0,0 +1,92 @@
+import functools
+import importlib
+import os
+import sys
+from urllib.parse import unquote_plus
+
+import orjson
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BASE_DIR)
+SRC_DIR = os.path.join(PROJECT_ROOT, "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+
+@functools.lru_cache(maxsize=1)
+def get_app_server():
+    """Import src/server.py once per process and share it across handlers."""
+    return importlib.import_module("server")
+
+
+def parse_query_fast(path, keys):
+    """Parse only the wanted keys out of the request path's query string.
+
+    Returns the same {key: [value]} shape parse_qs does (first value wins,
+    blank values dropped) but skips decoding parameters nobody reads.
+    """
+    query = {}
+    qs = path.partition("?")[2]
+    if not qs:
+        return query
+    for field in qs.split("&"):
+        name, sep, value = field.partition("=")
+        if not sep or not value:
+            continue
+        if "%" in name or "+" in name:
+            name = unquote_plus(name)
+        if name in keys and name not in query:
+            query[name] = [unquote_plus(value)]
+    return query
+
+
+def send_validated(handler, data, etag, gzipped=None, max_age=30):
+    """Send cacheable JSON, answering 304 when the client's ETag matches.
+
+    Takes the tuple from server.cached_response. Large bodies are sent
+    gzipped to clients that accept it and tagged with server.gzip_etag.
+    """
+    app_server = get_app_server()
+    cache_headers = {"Cache-Control": f"public, max-age={max_age}", "Vary": "Accept-Encoding"}
+    use_gzip = (
+        len(data) >= app_server.GZIP_MIN_SIZE
+        and "gzip" in handler.headers.get("Accept-Encoding", "")
+    )
+    if use_gzip:
+        etag = app_server.gzip_etag(etag)
+        cache_headers["Content-Encoding"] = "gzip"
+    cache_headers["ETag"] = etag
+    if handler.headers.get("If-None-Match") == etag:
+        handler.send_response(304)
+        for name in ("ETag", "Cache-Control", "Vary"):
+            handler.send_header(name, cache_headers[name])
+        handler.end_headers()
+        return
+    if use_gzip:
+        data = gzipped if gzipped is not None else app_server.gzip_body(data)
+    send_raw(handler, data, headers=cache_headers)
+
+
+def send_json(handler, payload, status=200):
+    send_raw(handler, orjson.dumps(payload), status=status)
+
+
+def send_raw(handler, data, status=200, headers=None):
+    """Write an already-serialized JSON body.
+
+    The status line, headers and body go out in a single wfile.write instead
+    of the several small writes send_response/send_header/end_headers make.
+    """
+    reason = handler.responses.get(status, ("",))[0]
+    lines = [
+        f"{handler.protocol_version} {status} {reason}",
+        f"Server: {handler.version_string()}",
+        f"Date: {handler.date_time_string()}",
+        "Content-Type: application/json; charset=utf-8",
+        f"Content-Length: {len(data)}",
+    ]
+    for name, value in (headers or {}).items():
+        lines.append(f"{name}: {value}")
+    head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+    handler.log_request(status, len(data))
+    handler.wfile.write(head + data)
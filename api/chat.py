@@ -1,47 +1,52 @@
-import json
-import os
-import sys
+import threading
 from http.server import BaseHTTPRequestHandler
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(BASE_DIR)
-SRC_DIR = os.path.join(PROJECT_ROOT, "src")
-if SRC_DIR not in sys.path:
-    sys.path.insert(0, SRC_DIR)
+import orjson
 
-import server as app_server
+from api._common import get_app_server, send_json, send_raw
 
+ERR_INVALID_JSON = orjson.dumps({"error": "Invalid JSON body."})
+ERR_NO_MESSAGES = orjson.dumps({"error": "No messages provided."})
 
-def send_json(handler, payload, status=200):
-    data = json.dumps(payload).encode("utf-8")
-    handler.send_response(status)
-    handler.send_header("Content-Type", "application/json; charset=utf-8")
-    handler.send_header("Content-Length", str(len(data)))
-    handler.end_headers()
-    handler.wfile.write(data)
+_VS_WARMUP_THREAD = None
+_VS_WARMUP_LOCK = threading.Lock()
+
+
+def start_vector_store_warmup():
+    """Build the vector store in the background unless it is ready or in progress."""
+    global _VS_WARMUP_THREAD
+    app_server = get_app_server()
+    with _VS_WARMUP_LOCK:
+        if app_server.VS_STATE[1].is_set():
+            return
+        if _VS_WARMUP_THREAD is not None and _VS_WARMUP_THREAD.is_alive():
+            return
+        _VS_WARMUP_THREAD = threading.Thread(target=app_server.setup_vector_store, daemon=True)
+        _VS_WARMUP_THREAD.start()
 
 
 class handler(BaseHTTPRequestHandler):
     def do_POST(self):
-        try:
-            length = int(self.headers.get("Content-Length", "0") or "0")
-        except ValueError:
-            length = 0
+        app_server = get_app_server()
+        length_header = self.headers.get("Content-Length")
+        # isdigit alone accepts digits like "²" that int() rejects.
+        valid = length_header and length_header.isascii() and length_header.isdigit()
+        length = int(length_header) if valid else 0
         body = self.rfile.read(length) if length > 0 else b""
         try:
-            payload = json.loads(body.decode("utf-8") or "{}")
-        except json.JSONDecodeError:
-            send_json(self, {"error": "Invalid JSON body."}, status=400)
+            payload = orjson.loads(body or b"{}")
+        except orjson.JSONDecodeError:
+            send_raw(self, ERR_INVALID_JSON, status=400)
             return
 
         messages = payload.get("messages", [])
         if not messages:
-            send_json(self, {"error": "No messages provided."}, status=400)
+            send_raw(self, ERR_NO_MESSAGES, status=400)
             return
 
-        # Ensure vector store is ready (may set up on first Vercel cold start)
-        if not app_server.VS_READY.is_set():
-            app_server.setup_vector_store()
+        # Retries setup if the warm-up attempt ended without a vector store;
+        # chat_with_data then waits on the VS_STATE ready event.
+        start_vector_store_warmup()
 
         try:
             response_text = app_server.chat_with_data(messages)
@@ -50,3 +55,7 @@ class handler(BaseHTTPRequestHandler):
             return
 
         send_json(self, {"response": response_text})
+
+
+# Start indexing at container spin-up instead of on the first chat request.
+start_vector_store_warmup()
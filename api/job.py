@@ -1,39 +1,27 @@
-import json
-import os
-import sys
 from http.server import BaseHTTPRequestHandler
-from urllib.parse import parse_qs, urlparse
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(BASE_DIR)
-SRC_DIR = os.path.join(PROJECT_ROOT, "src")
-if SRC_DIR not in sys.path:
-    sys.path.insert(0, SRC_DIR)
+import orjson
 
-import server as app_server
+from api._common import get_app_server, parse_query_fast, send_raw
 
+ERR_MISSING_SOURCE_URL = orjson.dumps({"error": "Missing source_url."})
+ERR_JOB_NOT_FOUND = orjson.dumps({"error": "Job not found."})
 
-def send_json(handler, payload, status=200):
-    data = json.dumps(payload).encode("utf-8")
-    handler.send_response(status)
-    handler.send_header("Content-Type", "application/json; charset=utf-8")
-    handler.send_header("Content-Length", str(len(data)))
-    handler.end_headers()
-    handler.wfile.write(data)
+SOURCE_URL_KEYS = frozenset({"source_url"})
 
 
 class handler(BaseHTTPRequestHandler):
     def do_GET(self):
-        parsed = urlparse(self.path)
-        query = parse_qs(parsed.query)
+        app_server = get_app_server()
+        query = parse_query_fast(self.path, SOURCE_URL_KEYS)
         source_url = query.get("source_url", [""])[0]
         if not source_url:
-            send_json(self, {"error": "Missing source_url."}, status=400)
+            send_raw(self, ERR_MISSING_SOURCE_URL, status=400)
             return
 
         job = app_server.find_job_by_source_url(app_server.ALL_JOBS, source_url)
         if not job:
-            send_json(self, {"error": "Job not found."}, status=404)
+            send_raw(self, ERR_JOB_NOT_FOUND, status=404)
             return
 
-        send_json(self, job)
+        send_raw(self, app_server.job_bytes(job))
@@ -1,44 +1,43 @@
-import json
-import os
-import sys
 from http.server import BaseHTTPRequestHandler
-from urllib.parse import parse_qs, urlparse
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(BASE_DIR)
-SRC_DIR = os.path.join(PROJECT_ROOT, "src")
-if SRC_DIR not in sys.path:
-    sys.path.insert(0, SRC_DIR)
+import orjson
 
-import server as app_server
+from api._common import get_app_server, parse_query_fast, send_raw, send_validated
 
+ERR_INVALID_PAGING = orjson.dumps({"error": "Invalid offset or limit."})
 
-def send_json(handler, payload, status=200):
-    data = json.dumps(payload).encode("utf-8")
-    handler.send_response(status)
-    handler.send_header("Content-Type", "application/json; charset=utf-8")
-    handler.send_header("Content-Length", str(len(data)))
-    handler.end_headers()
-    handler.wfile.write(data)
+QUERY_KEYS = frozenset(
+    {"offset", "limit", "q", "location", "posted_from", "posted_to", "min_score"}
+)
+JOBS_CACHE_SIZE = 128
+JOBS_CACHE_TTL = 30.0
+# (generation, offset, limit, filters) -> server.cached_response tuple
+_JOBS_CACHE = get_app_server().TTLCache(JOBS_CACHE_SIZE, JOBS_CACHE_TTL)
+
+
+def jobs_cache_key(generation, offset, limit, query):
+    filters = tuple(
+        sorted((key, tuple(values)) for key, values in query.items() if key not in ("offset", "limit"))
+    )
+    return (generation, offset, limit, filters)
 
 
 class handler(BaseHTTPRequestHandler):
     def do_GET(self):
-        parsed = urlparse(self.path)
-        query = parse_qs(parsed.query)
-        try:
-            offset = int(query.get("offset", [0])[0])
-            limit = int(query.get("limit", [6])[0])
-        except ValueError:
-            send_json(self, {"error": "Invalid offset or limit."}, status=400)
+        app_server = get_app_server()
+        query = parse_query_fast(self.path, QUERY_KEYS)
+        paging = app_server.parse_paging(query)
+        if paging is None:
+            send_raw(self, ERR_INVALID_PAGING, status=400)
             return
+        offset, limit = paging
 
-        filtered_jobs = app_server.filter_jobs(app_server.ALL_JOBS, query)
-        sliced = filtered_jobs[offset : offset + limit]
-        payload = {
-            "total": len(filtered_jobs),
-            "offset": offset,
-            "limit": limit,
-            "jobs": sliced,
-        }
-        send_json(self, payload)
+        key = jobs_cache_key(app_server.DATA_GENERATION, offset, limit, query)
+        cached = _JOBS_CACHE.get(key)
+        if cached is None:
+            filtered_jobs = app_server.filter_jobs(app_server.ALL_JOBS, query)
+            sliced = filtered_jobs[offset : offset + limit]
+            data = app_server.jobs_page_bytes(len(filtered_jobs), offset, limit, sliced)
+            cached = app_server.cached_response(data)
+            _JOBS_CACHE.put(key, cached)
+        send_validated(self, *cached)
@@ -1,26 +1,20 @@
-import json
-import os
-import sys
 from http.server import BaseHTTPRequestHandler
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(BASE_DIR)
-SRC_DIR = os.path.join(PROJECT_ROOT, "src")
-if SRC_DIR not in sys.path:
-    sys.path.insert(0, SRC_DIR)
+from api._common import get_app_server, send_validated
 
-import server as app_server
+# STATS never changes within a serverless process; reuse its serialized body
+# and compute the ETag (and gzip, if large enough) once.
+_STATS_CACHE = None
 
 
-def send_json(handler, payload, status=200):
-    data = json.dumps(payload).encode("utf-8")
-    handler.send_response(status)
-    handler.send_header("Content-Type", "application/json; charset=utf-8")
-    handler.send_header("Content-Length", str(len(data)))
-    handler.end_headers()
-    handler.wfile.write(data)
+def get_stats_cache():
+    global _STATS_CACHE
+    if _STATS_CACHE is None:
+        app_server = get_app_server()
+        _STATS_CACHE = app_server.cached_response(app_server.STATS_BYTES)
+    return _STATS_CACHE
 
 
 class handler(BaseHTTPRequestHandler):
     def do_GET(self):
-        send_json(self, app_server.STATS)
+        send_validated(self, *get_stats_cache())
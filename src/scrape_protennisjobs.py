@@ -1,16 +1,24 @@
 import csv
+import functools
+import hashlib
 import html
 import json
 import math
 import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
-from typing import Dict, List, Optional, Tuple
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from urllib.parse import urljoin
 
+import orjson
 import requests
-from bs4 import BeautifulSoup, NavigableString, Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -20,17 +28,20 @@ ENV_PATH = os.path.join(PROJECT_ROOT, ".env")
 
 
 def _load_dotenv(path: str) -> None:
-    if not os.path.exists(path):
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            text = file.read()
+    except FileNotFoundError:
         return
-    with open(path, "r", encoding="utf-8") as file:
-        for line in file:
-            line = line.strip()
-            if not line or line.startswith("#") or "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            key = key.strip()
-            value = value.strip().strip('"').strip("'")
-            os.environ.setdefault(key, value)
+    values: Dict[str, str] = {}
+    for line in text.splitlines():
+        key, sep, value = line.strip().partition("=")
+        key = key.strip()
+        if not sep or not key or key.startswith("#"):
+            continue
+        values.setdefault(key, value.strip().strip('"').strip("'"))
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
 
 
 _load_dotenv(ENV_PATH)
@@ -42,12 +53,26 @@ USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 GEOCODE_URL = "https://nominatim.openstreetmap.org/search"
 GEOCODE_USER_AGENT = "protennisjobs-scraper/1.0"
 GEOCODE_CACHE_FILE = os.path.join(DATA_DIR, "geocode_cache.json")
+US_CITIES_FILE = os.path.join(DATA_DIR, "us_cities.csv")
 GEOCODE_MIN_INTERVAL = 1.0
 FIT_SCORE_CACHE_FILE = os.path.join(DATA_DIR, "fit_score_cache.json")
+HTTP_CACHE_FILE = os.path.join(DATA_DIR, "http_cache.json")
+JOB_DETAILS_CACHE_FILE = os.path.join(DATA_DIR, "job_details_cache.json")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 OPENAI_API_URL = os.getenv("OPENAI_API_URL", "https://api.openai.com/v1/responses")
 OPENAI_MIN_INTERVAL = float(os.getenv("OPENAI_MIN_INTERVAL", "0.2"))
 OPENAI_MAX_INPUT_CHARS = int(os.getenv("OPENAI_MAX_INPUT_CHARS", "1500"))
+OPENAI_SCORE_WORKERS = max(1, int(os.getenv("OPENAI_SCORE_WORKERS", "8")))
+OPENAI_SCORE_BATCH_SIZE = max(1, int(os.getenv("OPENAI_SCORE_BATCH_SIZE", "10")))
+SCRAPE_WORKERS = max(1, int(os.getenv("PTJ_SCRAPE_WORKERS", "8")))
+# Ceiling on protennisjobs.com requests per second across all workers; 0 disables it.
+SCRAPE_MAX_RPS = float(os.getenv("PTJ_MAX_RPS", "4"))
+
+_EMAIL_RE = re.compile(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", re.I)
+_CITY_STATE_RE = re.compile(r"([A-Za-z .'-]+),\s*([A-Za-z]{2,})")
+_LOCATION_LINE_RE = re.compile(r"Location\s*[:\-]\s*([^\n\r]+)", re.I)
+_CITY_STATE_TEXT_RE = re.compile(r"\b([A-Za-z .'-]+,\s*[A-Za-z]{2})\b")
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.S)
 
 SESSION = requests.Session()
 SESSION.headers.update(
@@ -67,8 +92,37 @@ GEOCODE_SESSION.headers.update(
     }
 )
 
+# Pools sized to the worker counts so parallel threads keep their sockets alive.
+# 429/503 responses are retried with exponential backoff, honouring Retry-After.
+SCRAPE_RETRY = Retry(
+    total=5,
+    status_forcelist=(429, 503),
+    allowed_methods=("GET",),
+    backoff_factor=1.0,
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+SESSION.mount(
+    "https://", HTTPAdapter(pool_maxsize=max(10, SCRAPE_WORKERS), max_retries=SCRAPE_RETRY)
+)
 
-@dataclass
+OPENAI_SESSION = requests.Session()
+# Rate-limited (429) and overloaded (503) requests were never processed, so retrying the POST is safe.
+OPENAI_RETRY = Retry(
+    total=4,
+    status_forcelist=(429, 503),
+    allowed_methods=("POST",),
+    backoff_factor=2.0,
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+OPENAI_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_maxsize=max(16, OPENAI_SCORE_WORKERS), max_retries=OPENAI_RETRY),
+)
+
+
+@dataclass(slots=True)
 class JobListing:
     job_title: str
     location: Dict[str, Optional[str]]
@@ -195,19 +249,108 @@ def load_cookies() -> None:
         print("WARNING: No cookies loaded. Scraping may fail for login-protected pages.")
 
 
-def fetch_html(url: str, referer: Optional[str] = None) -> BeautifulSoup:
+# url -> {"etag", "last_modified", "text"} from the previous crawl, so repeat
+# runs only pay for conditional GETs on unchanged pages.
+HTTP_CACHE: Dict[str, Dict[str, Optional[str]]] = {}
+HTTP_CACHE_LOCK = threading.Lock()
+# URLs requested during this crawl; save_http_cache drops everything else.
+HTTP_CACHE_USED: Set[str] = set()
+
+NEXT_PAGE_REQUEST = 0.0
+PAGE_THROTTLE_LOCK = threading.Lock()
+
+
+def throttle_page_requests() -> None:
+    """Space protennisjobs.com requests 1 / SCRAPE_MAX_RPS apart across worker threads."""
+    global NEXT_PAGE_REQUEST
+    if SCRAPE_MAX_RPS <= 0:
+        return
+    with PAGE_THROTTLE_LOCK:
+        now = time.time()
+        start = max(now, NEXT_PAGE_REQUEST)
+        NEXT_PAGE_REQUEST = start + 1.0 / SCRAPE_MAX_RPS
+    if start > now:
+        time.sleep(start - now)
+
+
+def read_json_cache(path: str) -> Dict[str, object]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "rb") as handle:
+        data = orjson.loads(handle.read())
+    return data if isinstance(data, dict) else {}
+
+
+def write_json_cache(path: str, data: Dict[str, object], indent: bool = False) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0))
+    os.replace(tmp_path, path)
+
+
+def load_http_cache() -> None:
+    HTTP_CACHE.update(read_json_cache(HTTP_CACHE_FILE))
+    HTTP_CACHE_USED.clear()
+
+
+def save_http_cache(live_urls: Iterable[str] = ()) -> None:
+    """Write back pages fetched this crawl or still listed (live_urls).
+
+    Expired listings and old pagination pages are dropped so the file doesn't grow every run.
+    """
+    keep = HTTP_CACHE_USED.union(live_urls)
+    with HTTP_CACHE_LOCK:
+        for url in [url for url in HTTP_CACHE if url not in keep]:
+            del HTTP_CACHE[url]
+    write_json_cache(HTTP_CACHE_FILE, HTTP_CACHE)
+
+
+def get_page_text(url: str, referer: Optional[str]) -> str:
+    with HTTP_CACHE_LOCK:
+        HTTP_CACHE_USED.add(url)
+    cached = HTTP_CACHE.get(url)
     headers = {}
     if referer:
         headers["Referer"] = referer
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    throttle_page_requests()
     response = SESSION.get(url, headers=headers, timeout=30)
     if response.status_code == 403 and referer != CATEGORY_URL:
-        response = SESSION.get(url, headers={"Referer": CATEGORY_URL}, timeout=30)
+        headers["Referer"] = CATEGORY_URL
+        throttle_page_requests()
+        response = SESSION.get(url, headers=headers, timeout=30)
+    if response.status_code == 304 and cached:
+        return cached["text"] or ""
     response.raise_for_status()
-    return BeautifulSoup(response.text, "html.parser")
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        with HTTP_CACHE_LOCK:
+            HTTP_CACHE[url] = {"etag": etag, "last_modified": last_modified, "text": response.text}
+    return response.text
+
+
+# Category pages only need the listing cards and the pagination link. Detail pages
+# are parsed whole: their extractors read .entry-content, div.alert, JSON-LD and
+# mailto links wherever they sit, which no tag-name strainer can express safely.
+LISTING_STRAINER = SoupStrainer(class_=re.compile(r"(?:^|\s)(?:classified|next)(?:\s|$)"))
+
+
+def fetch_html(
+    url: str,
+    referer: Optional[str] = None,
+    parse_only: Optional[SoupStrainer] = None,
+) -> BeautifulSoup:
+    return BeautifulSoup(get_page_text(url, referer), "lxml", parse_only=parse_only)
 
 
 def normalize_whitespace(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    # str.split() splits on exactly the characters \s matches, without entering the regex engine.
+    return " ".join(text.split())
 
 
 def extract_text(element: Optional[Tag]) -> Optional[str]:
@@ -223,7 +366,7 @@ def parse_location(raw: Optional[str]) -> Dict[str, Optional[str]]:
     raw = normalize_whitespace(raw)
 
     # Match "City, ST" or "City, State"
-    match = re.search(r"([A-Za-z .'-]+),\s*([A-Za-z]{2,})", raw)
+    match = _CITY_STATE_RE.search(raw)
     if match:
         city = match.group(1).strip()
         state = match.group(2).strip()
@@ -235,12 +378,12 @@ def parse_location(raw: Optional[str]) -> Dict[str, Optional[str]]:
 
 def find_location_in_text(text: str) -> Optional[str]:
     # Look for "Location: City, ST" or "Location - City, ST"
-    match = re.search(r"Location\s*[:\-]\s*([^\n\r]+)", text, re.IGNORECASE)
+    match = _LOCATION_LINE_RE.search(text)
     if match:
         return normalize_whitespace(match.group(1))
 
     # Try to locate a city/state pattern in the text
-    match = re.search(r"\b([A-Za-z .'-]+,\s*[A-Za-z]{2})\b", text)
+    match = _CITY_STATE_TEXT_RE.search(text)
     if match:
         return normalize_whitespace(match.group(1))
 
@@ -257,69 +400,70 @@ def extract_posted_date(soup: BeautifulSoup) -> Optional[str]:
     return extract_text(date)
 
 
-def extract_json_ld_text(soup: BeautifulSoup) -> Optional[str]:
+def extract_json_ld(soup: BeautifulSoup) -> Dict[str, object]:
     script = soup.find("script", type="application/ld+json")
     if not script:
-        return None
-    return script.get_text() or None
+        return {}
+    try:
+        data = json.loads(script.get_text(), strict=False)
+    except json.JSONDecodeError:
+        return {}
+    if isinstance(data, dict) and isinstance(data.get("@graph"), list):
+        data = data["@graph"]
+    if isinstance(data, list):
+        postings = [item for item in data if isinstance(item, dict)]
+        data = next(
+            (item for item in postings if item.get("@type") == "JobPosting"),
+            postings[0] if postings else {},
+        )
+    return data if isinstance(data, dict) else {}
 
 
-def extract_json_ld_string(text: str, key: str) -> Optional[str]:
-    marker = f'"{key}"'
-    idx = text.find(marker)
-    if idx == -1:
+def json_ld_string(data: Dict[str, object], key: str) -> Optional[str]:
+    value = data.get(key)
+    if not isinstance(value, str) or not value:
         return None
-    colon = text.find(":", idx)
-    if colon == -1:
-        return None
-    quote = text.find('"', colon + 1)
-    if quote == -1:
-        return None
-    value_chars: List[str] = []
-    i = quote + 1
-    while i < len(text):
-        char = text[i]
-        if char == '"' and text[i - 1] != "\\":
-            break
-        value_chars.append(char)
-        i += 1
-    value = "".join(value_chars)
-    return html.unescape(value) if value else None
-
-
-def extract_json_ld_location(text: str) -> Dict[str, Optional[str]]:
-    city = extract_json_ld_string(text, "addressLocality")
-    state = extract_json_ld_string(text, "addressRegion")
+    return html.unescape(value)
+
+
+def extract_json_ld_location(data: Dict[str, object]) -> Dict[str, Optional[str]]:
+    job_location = data.get("jobLocation") or {}
+    if isinstance(job_location, list):
+        job_location = job_location[0] if job_location else {}
+    address = job_location.get("address") if isinstance(job_location, dict) else None
+    if not isinstance(address, dict):
+        return {"city": None, "state": None}
+    city = json_ld_string(address, "addressLocality")
+    state = json_ld_string(address, "addressRegion")
     if not city and not state:
-        street = extract_json_ld_string(text, "streetAddress")
-        return parse_location(street)
+        return parse_location(json_ld_string(address, "streetAddress"))
     return {"city": city, "state": state}
 
 
-def extract_contact_emails(soup: BeautifulSoup, description: str) -> Optional[str]:
-    emails: List[str] = []
-
-    contact_sections = []
+def find_contact_sections(soup: BeautifulSoup) -> List[Tag]:
+    sections = []
     for alert in soup.select("div.alert"):
         heading = alert.find(["h1", "h2", "h3", "h4"])
-        if heading and "contact details" in heading.get_text(" ", strip=True).lower():
-            contact_sections.append(alert.get_text(" ", strip=True))
+        if heading is None:
+            continue
+        heading_text = heading.get_text(" ", strip=True).lower()
+        if "contact details" in heading_text:
+            sections.append(alert)
+    return sections
 
-    for text in contact_sections:
-        for match in re.findall(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", text, re.I):
-            emails.append(match)
 
+def extract_contact_emails(soup: BeautifulSoup, description: str) -> Optional[str]:
+    sources = [description]
+    sources.extend(section.get_text(" ", strip=True) for section in find_contact_sections(soup))
     for link in soup.select('a[href^="mailto:"]'):
-        href = link.get("href", "")
-        address = href.replace("mailto:", "").split("?", 1)[0].strip()
-        if address:
-            emails.append(address)
+        sources.append(link.get("href", "")[7:].split("?", 1)[0])
 
-    for text in (description, extract_text(soup.select_one(".entry-content")) or ""):
-        for match in re.findall(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", text, re.I):
-            emails.append(match)
+    emails = _EMAIL_RE.findall("\n".join(sources))
+    # The JSON-LD description mirrors .entry-content; only walk the DOM when nothing was found.
+    if not emails:
+        emails = _EMAIL_RE.findall(extract_text(soup.select_one(".entry-content")) or "")
 
-    deduped = sorted({email.strip().lower() for email in emails if email.strip()})
+    deduped = sorted({email.lower() for email in emails})
     return ", ".join(deduped) if deduped else None
 
 
@@ -331,15 +475,10 @@ def extract_contact_details(soup: BeautifulSoup) -> Dict[str, Optional[str]]:
         "contact_address": None,
         "contact_url": None,
     }
-    section = None
-    for alert in soup.select("div.alert"):
-        heading = alert.find(["h1", "h2", "h3", "h4"])
-        if heading and "contact details" in heading.get_text(" ", strip=True).lower():
-            section = alert
-            break
-
-    if not section:
+    sections = find_contact_sections(soup)
+    if not sections:
         return details
+    section = sections[0]
 
     link = section.find("a", href=True)
     if link and link["href"]:
@@ -372,18 +511,10 @@ def extract_contact_details(soup: BeautifulSoup) -> Dict[str, Optional[str]]:
         elif label == "url":
             details["contact_url"] = value
 
-    if details["contact_email"]:
-        match = re.findall(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", details["contact_email"], re.I)
-        if match:
-            details["contact_email"] = match[0].lower()
-    else:
-        match = re.findall(
-            r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}",
-            section.get_text(" ", strip=True),
-            re.I,
-        )
-        if match:
-            details["contact_email"] = match[0].lower()
+    email_source = details["contact_email"] or section.get_text(" ", strip=True)
+    match = _EMAIL_RE.search(email_source)
+    if match:
+        details["contact_email"] = match.group(0).lower()
 
     return details
 
@@ -439,6 +570,12 @@ SECTION_KEYWORDS = {
     ],
 }
 
+# One alternation per key, checked in SECTION_KEYWORDS order so the first key wins.
+_SECTION_PATTERNS = [
+    (key, re.compile("|".join(map(re.escape, keywords)), re.I))
+    for key, keywords in SECTION_KEYWORDS.items()
+]
+
 WINTER_FIT_CRITERIA = (
     "I want a club willing to take me in for the winter season, not only full time or for "
     "the summer season. I want to work from August 2026 to April/May 2027."
@@ -446,9 +583,8 @@ WINTER_FIT_CRITERIA = (
 
 
 def match_section_key(heading_text: str) -> Optional[str]:
-    text = heading_text.lower()
-    for key, keywords in SECTION_KEYWORDS.items():
-        if any(keyword in text for keyword in keywords):
+    for key, pattern in _SECTION_PATTERNS:
+        if pattern.search(heading_text):
             return key
     return None
 
@@ -459,11 +595,12 @@ def extract_sections_from_description(description: str) -> Dict[str, str]:
     current_parts: List[str] = []
 
     def flush():
-        nonlocal current_key, current_parts
+        nonlocal current_key
         if current_key and current_parts:
+            # Stripped lines can still hold interior runs ("a   b"), so normalize the join.
             sections[current_key] = normalize_whitespace(" ".join(current_parts))
         current_key = None
-        current_parts = []
+        current_parts.clear()
 
     lines = [line.strip() for line in description.splitlines()]
     for line in lines:
@@ -481,32 +618,29 @@ def extract_sections_from_description(description: str) -> Dict[str, str]:
     flush()
 
     if not sections:
-        for line in lines:
-            for key, keywords in SECTION_KEYWORDS.items():
-                if any(keyword in line.lower() for keyword in keywords):
-                    sections.setdefault(key, line)
+        # The earliest hit in the whole text lies on the first matching line,
+        # so one scan per key replaces the per-line loop.
+        text = "\n".join(lines)
+        for key, pattern in _SECTION_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                start = text.rfind("\n", 0, match.start()) + 1
+                end = text.find("\n", match.end())
+                sections[key] = text[start : end if end != -1 else None]
 
     return sections
 
 
 def load_fit_score_cache() -> Dict[str, Optional[int]]:
-    if not os.path.exists(FIT_SCORE_CACHE_FILE):
-        return {}
-    with open(FIT_SCORE_CACHE_FILE, "r", encoding="utf-8") as handle:
-        data = json.load(handle)
-    return data if isinstance(data, dict) else {}
+    return read_json_cache(FIT_SCORE_CACHE_FILE)
 
 
 def save_fit_score_cache(cache: Dict[str, Optional[int]]) -> None:
-    with open(FIT_SCORE_CACHE_FILE, "w", encoding="utf-8") as handle:
-        json.dump(cache, handle, ensure_ascii=False, indent=2)
+    write_json_cache(FIT_SCORE_CACHE_FILE, cache, indent=True)
 
 
 def build_fit_prompt(job: JobListing) -> str:
-    parts = [
-        f"Criteria: {WINTER_FIT_CRITERIA}",
-        f"Job Title: {job.job_title}",
-    ]
+    parts = [f"Job Title: {job.job_title}"]
     location = job.location or {}
     city = location.get("city")
     state = location.get("state")
@@ -550,26 +684,44 @@ def extract_openai_text(payload: Dict[str, object]) -> Optional[str]:
     return None
 
 
-def parse_score_from_text(text: str) -> Optional[int]:
-    match = re.search(r"\{.*\}", text, re.S)
+def clamp_score(score: object) -> Optional[int]:
+    if isinstance(score, (int, float)) and not isinstance(score, bool):
+        return max(0, min(10, int(round(score))))
+    return None
+
+
+def parse_scores_from_text(text: str, count: int) -> List[Optional[int]]:
+    scores: List[Optional[int]] = [None] * count
+    match = _JSON_BLOCK_RE.search(text)
     if not match:
-        return None
+        return scores
     try:
         data = json.loads(match.group(0))
     except json.JSONDecodeError:
-        return None
-    score = data.get("score")
-    if isinstance(score, (int, float)):
-        score = int(round(score))
-        return max(0, min(10, score))
-    return None
+        return scores
+    entries = data.get("scores") if isinstance(data, dict) else None
+    if not isinstance(entries, list):
+        return scores
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        # Models often return ids as numeric strings ("2").
+        try:
+            job_id = int(entry.get("id"))
+        except (TypeError, ValueError):
+            continue
+        if 1 <= job_id <= count:
+            scores[job_id - 1] = clamp_score(entry.get("score"))
+    return scores
 
 
-def fetch_openai_score(prompt: str, api_key: str) -> Optional[int]:
+def fetch_openai_scores(prompts: List[str], api_key: str) -> List[Optional[int]]:
+    """Score a batch of job prompts in one request, returning scores in prompt order."""
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
+    jobs_text = "\n\n".join(f"[Job {index}]\n{prompt}" for index, prompt in enumerate(prompts, 1))
     payload = {
         "model": OPENAI_MODEL,
         "input": [
@@ -580,19 +732,42 @@ def fetch_openai_score(prompt: str, api_key: str) -> Optional[int]:
             {
                 "role": "user",
                 "content": (
-                    f"{prompt}\n\n"
-                    "Return JSON in this exact shape: "
-                    '{"score": 0-10, "rationale": "short reason"}'
+                    f"Criteria: {WINTER_FIT_CRITERIA}\n\n"
+                    "Score each job below against the criteria.\n\n"
+                    f"{jobs_text}\n\n"
+                    "Return JSON in this exact shape, with one entry per job: "
+                    '{"scores": [{"id": 1, "score": 0-10}]}'
                 ),
             },
         ],
         "temperature": 0.2,
-        "max_output_tokens": 120,
+        "max_output_tokens": 40 + 20 * len(prompts),
     }
-    response = requests.post(OPENAI_API_URL, headers=headers, json=payload, timeout=45)
+    response = OPENAI_SESSION.post(OPENAI_API_URL, headers=headers, json=payload, timeout=90)
     response.raise_for_status()
     text = extract_openai_text(response.json()) or ""
-    return parse_score_from_text(text)
+    return parse_scores_from_text(text, len(prompts))
+
+
+NEXT_OPENAI_REQUEST = 0.0
+OPENAI_THROTTLE_LOCK = threading.Lock()
+
+
+def throttle_openai() -> None:
+    """Space request starts OPENAI_MIN_INTERVAL apart across worker threads."""
+    global NEXT_OPENAI_REQUEST
+    with OPENAI_THROTTLE_LOCK:
+        now = time.time()
+        start = max(now, NEXT_OPENAI_REQUEST)
+        NEXT_OPENAI_REQUEST = start + OPENAI_MIN_INTERVAL
+    if start > now:
+        time.sleep(start - now)
+
+
+def fit_cache_key(prompt: str) -> str:
+    # Keyed by what the model sees, so edited listings or criteria get rescored.
+    source = f"{OPENAI_MODEL}\0{WINTER_FIT_CRITERIA}\0{prompt}"
+    return hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def score_jobs_with_ai(jobs: List[JobListing]) -> None:
@@ -602,45 +777,57 @@ def score_jobs_with_ai(jobs: List[JobListing]) -> None:
         return
 
     cache = load_fit_score_cache()
-    last_request = 0.0
 
+    job_keys: List[str] = []
+    uncached: Dict[str, str] = {}
     for job in jobs:
-        cache_key = job.source_url
-        if cache_key in cache:
-            job.suitability_score = cache.get(cache_key)
-            continue
-
         prompt = build_fit_prompt(job)
-        elapsed = time.time() - last_request
-        if elapsed < OPENAI_MIN_INTERVAL:
-            time.sleep(OPENAI_MIN_INTERVAL - elapsed)
-        last_request = time.time()
+        cache_key = fit_cache_key(prompt)
+        job_keys.append(cache_key)
+        # None entries (failed batches cached by older runs) are retried too.
+        if cache.get(cache_key) is None:
+            uncached.setdefault(cache_key, prompt)
+
+    pending = list(uncached.items())
+    batches = [
+        pending[start : start + OPENAI_SCORE_BATCH_SIZE]
+        for start in range(0, len(pending), OPENAI_SCORE_BATCH_SIZE)
+    ]
 
+    def score(batch: List[Tuple[str, str]]) -> List[Optional[int]]:
+        throttle_openai()
         try:
-            score = fetch_openai_score(prompt, api_key)
+            return fetch_openai_scores([prompt for _, prompt in batch], api_key)
         except requests.RequestException:
-            score = None
+            return [None] * len(batch)
+
+    if batches:
+        with ThreadPoolExecutor(max_workers=OPENAI_SCORE_WORKERS) as executor:
+            for batch, scores in zip(batches, executor.map(score, batches)):
+                # Only cache scores that came back; failed or unparseable
+                # entries stay uncached so the next run retries them.
+                for (cache_key, _), job_score in zip(batch, scores):
+                    if job_score is not None:
+                        cache[cache_key] = job_score
 
-        job.suitability_score = score
-        cache[cache_key] = score
+    for job, cache_key in zip(jobs, job_keys):
+        job.suitability_score = cache.get(cache_key)
 
-    save_fit_score_cache(cache)
+    # Keep only this run's prompts so edited listings, expired listings and
+    # old URL-keyed entries don't pile up in the file.
+    live_keys = set(job_keys)
+    save_fit_score_cache({key: score for key, score in cache.items() if key in live_keys})
 
 
 LAST_GEOCODE_REQUEST = 0.0
 
 
 def load_geocode_cache() -> Dict[str, Optional[Dict[str, float]]]:
-    if not os.path.exists(GEOCODE_CACHE_FILE):
-        return {}
-    with open(GEOCODE_CACHE_FILE, "r", encoding="utf-8") as handle:
-        data = json.load(handle)
-    return data if isinstance(data, dict) else {}
+    return read_json_cache(GEOCODE_CACHE_FILE)
 
 
 def save_geocode_cache(cache: Dict[str, Optional[Dict[str, float]]]) -> None:
-    with open(GEOCODE_CACHE_FILE, "w", encoding="utf-8") as handle:
-        json.dump(cache, handle, ensure_ascii=False, indent=2)
+    write_json_cache(GEOCODE_CACHE_FILE, cache, indent=True)
 
 
 def throttle_geocoding() -> None:
@@ -658,6 +845,33 @@ def location_cache_key(city: Optional[str], state: Optional[str]) -> Optional[st
     return ", ".join(parts)
 
 
+@functools.lru_cache(maxsize=1)
+def load_us_cities() -> Dict[str, Tuple[float, float]]:
+    """Optional offline gazetteer (e.g. the SimpleMaps US cities CSV).
+
+    Each row is indexed under its state code and its full state name, since
+    listings carry full names ("Kentucky") while gazetteers often key on codes.
+    """
+    cities: Dict[str, Tuple[float, float]] = {}
+    if not os.path.exists(US_CITIES_FILE):
+        return cities
+    with open(US_CITIES_FILE, "r", encoding="utf-8", newline="") as handle:
+        for row in csv.DictReader(handle):
+            lat = row.get("lat")
+            lon = row.get("lng") or row.get("lon")
+            if not lat or not lon:
+                continue
+            try:
+                coords = (float(lat), float(lon))
+            except ValueError:
+                continue
+            for state in (row.get("state_id"), row.get("state_name"), row.get("state")):
+                key = location_cache_key(row.get("city"), state)
+                if key and state and key not in cities:
+                    cities[key] = coords
+    return cities
+
+
 def geocode_city_state(
     city: Optional[str],
     state: Optional[str],
@@ -666,6 +880,9 @@ def geocode_city_state(
     key = location_cache_key(city, state)
     if not key:
         return None
+    local = load_us_cities().get(key)
+    if local:
+        return local
     cached = cache.get(key)
     if cached is not None:
         return (cached["lat"], cached["lon"])
@@ -694,35 +911,38 @@ def geocode_city_state(
     return (coords["lat"], coords["lon"])
 
 
-def haversine_miles(
-    lat1: float,
-    lon1: float,
-    lat2: float,
-    lon2: float,
-) -> float:
-    radius_miles = 3958.7613
-    phi1 = math.radians(lat1)
-    phi2 = math.radians(lat2)
-    delta_phi = math.radians(lat2 - lat1)
-    delta_lambda = math.radians(lon2 - lon1)
-    a = math.sin(delta_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
+EARTH_RADIUS_MILES = 3958.7613
+HARROGATE_TN_LAT = 36.5823
+HARROGATE_TN_LON = -83.6566
+_HARROGATE_LAT_RAD = math.radians(HARROGATE_TN_LAT)
+_HARROGATE_COS_LAT = math.cos(_HARROGATE_LAT_RAD)
+
+
+def miles_to_harrogate(lat: float, lon: float) -> float:
+    phi1 = math.radians(lat)
+    delta_phi = _HARROGATE_LAT_RAD - phi1
+    delta_lambda = math.radians(HARROGATE_TN_LON - lon)
+    a = (
+        math.sin(delta_phi / 2) ** 2
+        + math.cos(phi1) * _HARROGATE_COS_LAT * math.sin(delta_lambda / 2) ** 2
+    )
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return radius_miles * c
+    return EARTH_RADIUS_MILES * c
 
 
 def populate_distance_to_harrogate(jobs: List[JobListing]) -> None:
     cache = load_geocode_cache()
-    harrogate_coords = geocode_city_state("Harrogate", "TN", cache)
+    # Many listings share a city; geocode and measure each distinct location once.
+    distances: Dict[Optional[str], Optional[float]] = {}
     for job in jobs:
         location = job.location or {}
-        coords = geocode_city_state(location.get("city"), location.get("state"), cache)
-        if coords and harrogate_coords:
-            job.distance_to_harrogate_tn_miles = round(
-                haversine_miles(coords[0], coords[1], harrogate_coords[0], harrogate_coords[1]),
-                1,
-            )
-        else:
-            job.distance_to_harrogate_tn_miles = None
+        city = location.get("city")
+        state = location.get("state")
+        key = location_cache_key(city, state)
+        if key not in distances:
+            coords = geocode_city_state(city, state, cache)
+            distances[key] = round(miles_to_harrogate(*coords), 1) if coords else None
+        job.distance_to_harrogate_tn_miles = distances[key]
     save_geocode_cache(cache)
 
 
@@ -760,14 +980,13 @@ def extract_job_details(
                 source_url=job_url,
             )
         raise
-    json_ld = extract_json_ld_text(soup) or ""
+    json_ld = extract_json_ld(soup)
 
-    description = extract_json_ld_string(json_ld, "description") or ""
-    description = html.unescape(description)
+    description = json_ld_string(json_ld, "description") or ""
     description = description.replace("\r\n", "\n").replace("\r", "\n")
 
-    title = extract_json_ld_string(json_ld, "title") or listing_title or "Unknown"
-    posted_date = extract_json_ld_string(json_ld, "datePosted") or listing_date
+    title = json_ld_string(json_ld, "title") or listing_title or "Unknown"
+    posted_date = json_ld_string(json_ld, "datePosted") or listing_date
     location = extract_json_ld_location(json_ld)
     if not location.get("city") and listing_location:
         location = parse_location(listing_location)
@@ -807,7 +1026,7 @@ def extract_job_details(
 
 
 def extract_listings_from_page(page_url: str) -> Tuple[List[Dict[str, Optional[str]]], Optional[str]]:
-    soup = fetch_html(page_url)
+    soup = fetch_html(page_url, parse_only=LISTING_STRAINER)
     listings: List[Dict[str, Optional[str]]] = []
 
     for container in soup.select("div.classified"):
@@ -840,28 +1059,102 @@ def extract_listings_from_page(page_url: str) -> Tuple[List[Dict[str, Optional[s
     return listings, next_url
 
 
+def load_job_details_cache() -> Dict[str, Dict[str, object]]:
+    return read_json_cache(JOB_DETAILS_CACHE_FILE)
+
+
+def save_job_details_cache(
+    cache: Dict[str, Dict[str, object]], live_urls: Iterable[str]
+) -> None:
+    """Write back details for listings still on the site; expired ones are dropped."""
+    live = set(live_urls)
+    write_json_cache(
+        JOB_DETAILS_CACHE_FILE, {url: entry for url, entry in cache.items() if url in live}
+    )
+
+
+def listing_fingerprint(listing: Dict[str, Optional[str]]) -> List[Optional[str]]:
+    # A reposted or edited listing changes its date or summary on the category page.
+    return [listing.get("listing_date"), listing.get("summary")]
+
+
 def scrape_all_listings() -> List[JobListing]:
-    all_jobs: List[JobListing] = []
+    load_http_cache()
+    details_cache = load_job_details_cache()
+
+    def fetch_details(listing: Dict[str, Optional[str]]) -> JobListing:
+        fingerprint = listing_fingerprint(listing)
+        cached = details_cache.get(listing["url"])
+        if cached and cached.get("fingerprint") == fingerprint:
+            return JobListing(**cached["job"])
+        job = extract_job_details(
+            listing["url"],
+            listing.get("summary"),
+            listing.get("listing_title"),
+            listing.get("listing_location"),
+            listing.get("listing_date"),
+        )
+        # Skip the bare 403 fallback so the page is retried on the next run.
+        if job.position_overview or job.contact_emails or job.contact_name:
+            details_cache[listing["url"]] = {"fingerprint": fingerprint, "job": asdict(job)}
+        return job
+
     seen_urls = set()
+    futures = []
     next_url = CATEGORY_URL
-
-    while next_url:
-        listings, next_url = extract_listings_from_page(next_url)
-        for listing in listings:
-            job_url = listing["url"]
-            if job_url in seen_urls:
-                continue
-            seen_urls.add(job_url)
-            job = extract_job_details(
-                job_url,
-                listing.get("summary"),
-                listing.get("listing_title"),
-                listing.get("listing_location"),
-                listing.get("listing_date"),
-            )
-            all_jobs.append(job)
-
-    return all_jobs
+    with ThreadPoolExecutor(max_workers=SCRAPE_WORKERS) as executor:
+        # Pagination is inherently serial (each page links to the next), but the
+        # workers start on a page's detail pages while the next page downloads.
+        while next_url:
+            page_listings, next_url = extract_listings_from_page(next_url)
+            for listing in page_listings:
+                job_url = listing["url"]
+                if job_url in seen_urls:
+                    continue
+                seen_urls.add(job_url)
+                futures.append(executor.submit(fetch_details, listing))
+        jobs = [future.result() for future in futures]
+    # Listings answered from the details cache weren't fetched, but are still
+    # live, so their pages stay cached for when they change.
+    save_http_cache(seen_urls)
+    save_job_details_cache(details_cache, seen_urls)
+    return jobs
+
+
+def write_json(path: str, jobs: List[JobListing]) -> None:
+    # Still a JSON array, but streamed one job per line so the whole document is never
+    # held in memory. orjson serializes the dataclasses natively, in field order.
+    with open(path, "wb") as handle:
+        handle.write(b"[")
+        separator = b"\n"
+        for job in jobs:
+            handle.write(separator)
+            handle.write(orjson.dumps(job))
+            separator = b",\n"
+        handle.write(b"\n]\n")
+
+
+# Columns after location_city/location_state, read in one C-level call per row.
+_CSV_ROW_FIELDS = attrgetter(
+    "posted_date",
+    "distance_to_harrogate_tn_miles",
+    "job_summary",
+    "position_overview",
+    "suitability_score",
+    "key_responsibilities",
+    "required_qualifications",
+    "preferred_certifications",
+    "compensation_benefits",
+    "work_schedule",
+    "physical_requirements",
+    "how_to_apply",
+    "contact_emails",
+    "contact_name",
+    "contact_city",
+    "contact_address",
+    "contact_url",
+    "source_url",
+)
 
 
 def write_csv(path: str, jobs: List[JobListing]) -> None:
@@ -888,36 +1181,15 @@ def write_csv(path: str, jobs: List[JobListing]) -> None:
         "contact_url",
         "source_url",
     ]
-    with open(path, "w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for job in jobs:
-            location = job.location or {}
-            writer.writerow(
-                {
-                    "job_title": job.job_title,
-                    "location_city": location.get("city"),
-                    "location_state": location.get("state"),
-                    "posted_date": job.posted_date,
-                    "Distance to Harrogate, TN": job.distance_to_harrogate_tn_miles,
-                    "job_summary": job.job_summary,
-                    "position_overview": job.position_overview,
-                    "suitability_score": job.suitability_score,
-                    "key_responsibilities": job.key_responsibilities,
-                    "required_qualifications": job.required_qualifications,
-                    "preferred_certifications": job.preferred_certifications,
-                    "compensation_benefits": job.compensation_benefits,
-                    "work_schedule": job.work_schedule,
-                    "physical_requirements": job.physical_requirements,
-                    "how_to_apply": job.how_to_apply,
-                    "contact_emails": job.contact_emails,
-                    "contact_name": job.contact_name,
-                    "contact_city": job.contact_city,
-                    "contact_address": job.contact_address,
-                    "contact_url": job.contact_url,
-                    "source_url": job.source_url,
-                }
-            )
+
+    def csv_row(job: JobListing) -> Tuple[object, ...]:
+        location = job.location or {}
+        return (job.job_title, location.get("city"), location.get("state"), *_CSV_ROW_FIELDS(job))
+
+    with open(path, "w", encoding="utf-8", newline="", buffering=1 << 20) as handle:
+        writer = csv.writer(handle)
+        writer.writerow(fieldnames)
+        writer.writerows(map(csv_row, jobs))
 
 
 def main() -> None:
@@ -925,13 +1197,15 @@ def main() -> None:
     jobs = scrape_all_listings()
     populate_distance_to_harrogate(jobs)
     score_jobs_with_ai(jobs)
-    payload = [asdict(job) for job in jobs]
     json_path = os.path.join(DATA_DIR, "protennisjobs.json")
     csv_path = os.path.join(DATA_DIR, "protennisjobs.csv")
-    with open(json_path, "w", encoding="utf-8") as handle:
-        json.dump(payload, handle, ensure_ascii=False, indent=2)
-    print(f"Saved {len(payload)} job listings to {json_path}")
-    write_csv(csv_path, jobs)
+    # The two exports are independent files; let one's disk writes overlap the other's encoding.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        json_future = executor.submit(write_json, json_path, jobs)
+        csv_future = executor.submit(write_csv, csv_path, jobs)
+        json_future.result()
+        csv_future.result()
+    print(f"Saved {len(jobs)} job listings to {json_path}")
 
 
 if __name__ == "__main__":
@@ -1,15 +1,32 @@
 import atexit
+import bisect
 import csv
+import functools
+import gzip
 import hashlib
+import hmac
+import ipaddress
 import json
 import os
+import random
+import re
+import sys
 import threading
 import time
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -19,45 +36,106 @@ WEB_DIR = os.path.join(PROJECT_ROOT, "web")
 CSV_PATH = os.path.join(DATA_DIR, "protennisjobs.csv")
 REFRESH_INTERVAL_DAYS = float(os.getenv("PTJ_REFRESH_DAYS", "3"))
 REFRESH_ENABLED = REFRESH_INTERVAL_DAYS > 0
+REFRESH_JITTER = 0.05
 ENV_PATH = os.path.join(PROJECT_ROOT, ".env")
 PID_PATH = os.path.join(PROJECT_ROOT, ".server.pid")
 
 
 def load_dotenv(path):
-    if not os.path.exists(path):
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            text = file.read()
+    except FileNotFoundError:
         return
-    with open(path, "r", encoding="utf-8") as file:
-        for line in file:
-            line = line.strip()
-            if not line or line.startswith("#") or "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            key = key.strip()
-            value = value.strip().strip('"').strip("'")
-            os.environ.setdefault(key, value)
+    for line in text.splitlines():
+        key, sep, value = line.strip().partition("=")
+        key = key.strip()
+        if not sep or not key or key.startswith("#"):
+            continue
+        os.environ.setdefault(key, value.strip().strip('"').strip("'"))
 
 
 load_dotenv(ENV_PATH)
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
+# Lets non-loopback clients trigger POST /api/refresh with "Authorization: Bearer <token>".
+REFRESH_TOKEN = os.getenv("PTJ_REFRESH_TOKEN", "")
 OPENAI_MODEL = os.getenv("OPENAI_EMAIL_MODEL", "gpt-4o-mini")
 OPENAI_API_URL = os.getenv("OPENAI_API_URL", "https://api.openai.com/v1/responses")
 OPENAI_CHAT_MODEL = os.getenv("OPENAI_CHAT_MODEL", "gpt-4.1-mini")
 
+# Seconds an idle keep-alive client connection may hold a server thread.
+KEEPALIVE_TIMEOUT = 30
+
+# One keep-alive session for every OpenAI call so requests reuse TLS connections.
+# The pool is sized for concurrent chat/email-draft threads; the default of 10
+# would drop and reopen connections under bursts.
+OPENAI_SESSION = requests.Session()
+OPENAI_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+# Request headers never change after startup, so build them once.
+OPENAI_AUTH_HEADERS = {"Authorization": f"Bearer {OPENAI_API_KEY}"}
+OPENAI_JSON_HEADERS = {**OPENAI_AUTH_HEADERS, "Content-Type": "application/json"}
+VS_HEADERS = {**OPENAI_JSON_HEADERS, "OpenAI-Beta": "assistants=v2"}
+
+
+MONTHS = {
+    name: number
+    for number, name in enumerate(
+        (
+            "january",
+            "february",
+            "march",
+            "april",
+            "may",
+            "june",
+            "july",
+            "august",
+            "september",
+            "october",
+            "november",
+            "december",
+        ),
+        1,
+    )
+}
+
+
+def _is_number(text, min_len, max_len):
+    return min_len <= len(text) <= max_len and text.isascii() and text.isdigit()
+
 
+# Both formats are fixed, so they are split by hand instead of going through
+# strptime's regex machinery; results are memoized since values repeat.
+@functools.lru_cache(maxsize=4096)
 def parse_date(value):
+    """Parse a listing date such as "5 February 2026"."""
     if not value:
         return None
+    parts = value.split()
+    if len(parts) != 3:
+        return None
+    day, month, year = parts
+    month = MONTHS.get(month.lower())
+    if month is None or not _is_number(day, 1, 2) or not _is_number(year, 4, 4):
+        return None
     try:
-        return datetime.strptime(value.strip(), "%d %B %Y")
+        return datetime(int(year), month, int(day))
     except ValueError:
         return None
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_query_date(value):
+    """Parse a YYYY-MM-DD query parameter."""
     if not value:
         return None
+    parts = value.strip().split("-")
+    if len(parts) != 3:
+        return None
+    year, month, day = parts
+    if not (_is_number(year, 4, 4) and _is_number(month, 1, 2) and _is_number(day, 1, 2)):
+        return None
     try:
-        return datetime.strptime(value.strip(), "%Y-%m-%d")
+        return datetime(int(year), int(month), int(day))
     except ValueError:
         return None
 
@@ -66,6 +144,10 @@ def normalize_text(value):
     return value.strip().lower() if value else ""
 
 
+# Open PID file whose flock marks this process as the running server.
+_INSTANCE_LOCK = None
+
+
 def _pid_is_running(pid):
     if not pid or pid <= 0:
         return False
@@ -77,6 +159,36 @@ def _pid_is_running(pid):
 
 
 def ensure_single_instance():
+    """Refuse to start while another server holds the lock on PID_PATH.
+
+    The flock is released by the OS when the process exits, however it
+    exits, so a stale PID file never blocks a restart. Platforms without
+    fcntl fall back to checking the PID recorded in the file.
+    """
+    global _INSTANCE_LOCK
+    if fcntl is None:
+        _ensure_single_instance_by_pid()
+        return
+    try:
+        # "a+" so a running server's PID isn't wiped before we hold the lock.
+        handle = open(PID_PATH, "a+", encoding="utf-8")
+    except OSError:
+        return
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.seek(0)
+        existing_pid = handle.read().strip() or "unknown"
+        handle.close()
+        raise RuntimeError(f"Server already running (pid {existing_pid}). Stop it first.")
+    handle.seek(0)
+    handle.truncate()
+    handle.write(str(os.getpid()))
+    handle.flush()
+    _INSTANCE_LOCK = handle
+
+
+def _ensure_single_instance_by_pid():
     existing_pid = None
     if os.path.exists(PID_PATH):
         try:
@@ -109,16 +221,25 @@ def ensure_single_instance():
     atexit.register(_cleanup_pid)
 
 
+_ORG_NAME_RE = re.compile(r"club|academy|resort|cent(?:er|re)", re.IGNORECASE)
+
+
 def extract_org_name(job):
     summary = (job.get("job_summary") or "").strip()
-    if summary and " is looking for" in summary:
-        return summary.split(" is looking for", 1)[0].strip()
+    org, looking_for, _ = summary.partition(" is looking for")
+    if looking_for:
+        return org.strip()
     contact_name = (job.get("contact_name") or "").strip()
-    if contact_name and any(keyword in contact_name.lower() for keyword in ["club", "academy", "resort", "center", "centre"]):
+    if contact_name and _ORG_NAME_RE.search(contact_name):
         return contact_name
     return ""
 
 
+# Hostname of an absolute URL, the part urlparse(...).hostname returns,
+# without running the full parser for every CSV row.
+_URL_HOST_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://(?:[^/?#]*@)?([^/?#:]*)")
+
+
 def infer_contact_name(job_summary, contact_name, contact_url):
     if contact_name:
         return contact_name
@@ -126,7 +247,8 @@ def infer_contact_name(job_summary, contact_name, contact_url):
     if inferred:
         return inferred
     if contact_url:
-        host = urlparse(contact_url).hostname or ""
+        match = _URL_HOST_RE.match(contact_url)
+        host = match.group(1).lower() if match else ""
         if host:
             host = host[4:] if host.startswith("www.") else host
             parts = host.split(".")
@@ -135,80 +257,284 @@ def infer_contact_name(job_summary, contact_name, contact_url):
     return ""
 
 
+# Column order load_jobs unpacks; looked up by header name so the CSV can reorder them.
+CSV_COLUMNS = (
+    "job_title",
+    "location_city",
+    "location_state",
+    "posted_date",
+    "Distance to Harrogate, TN",
+    "job_summary",
+    "position_overview",
+    "suitability_score",
+    "key_responsibilities",
+    "required_qualifications",
+    "preferred_certifications",
+    "compensation_benefits",
+    "work_schedule",
+    "physical_requirements",
+    "how_to_apply",
+    "contact_emails",
+    "contact_name",
+    "contact_city",
+    "contact_address",
+    "contact_url",
+    "source_url",
+)
+
+
 def load_jobs():
     jobs = []
     with open(CSV_PATH, newline="", encoding="utf-8") as file:
-        reader = csv.DictReader(file)
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            return jobs
+        index = {name: i for i, name in enumerate(header)}
+        width = len(header)
+        # Missing columns point one past the header. Rows are trimmed to the
+        # header and padded with "", so that slot is always empty.
+        columns = [index.get(name, width) for name in CSV_COLUMNS]
         for row in reader:
-            job = {
-                "job_title": row.get("job_title") or "Tennis Role",
-                "location": {
-                    "city": row.get("location_city") or "Unknown City",
-                    "state": row.get("location_state") or "Unknown",
-                },
-                "posted_date": row.get("posted_date") or "",
-                "distance_to_harrogate_tn_miles": None,
-                "job_summary": row.get("job_summary") or "",
-                "position_overview": row.get("position_overview") or "",
-                "suitability_score": None,
-                "key_responsibilities": row.get("key_responsibilities") or "",
-                "required_qualifications": row.get("required_qualifications") or "",
-                "preferred_certifications": row.get("preferred_certifications") or "",
-                "compensation_benefits": row.get("compensation_benefits") or "",
-                "work_schedule": row.get("work_schedule") or "",
-                "physical_requirements": row.get("physical_requirements") or "",
-                "how_to_apply": row.get("how_to_apply") or "",
-                "contact_emails": row.get("contact_emails") or "",
-                "contact_name": infer_contact_name(
-                    row.get("job_summary"),
-                    row.get("contact_name"),
-                    row.get("contact_url"),
-                )
-                or "Unknown org",
-                "contact_city": row.get("contact_city") or "",
-                "contact_address": row.get("contact_address") or "",
-                "contact_url": row.get("contact_url") or "",
-                "source_url": row.get("source_url") or "",
-            }
-
-            score = row.get("suitability_score")
-            try:
-                job["suitability_score"] = int(score) if score else None
-            except ValueError:
-                job["suitability_score"] = None
+            if not row:
+                continue
+            if len(row) > width:
+                del row[width:]
+            row.extend([""] * (width + 1 - len(row)))
+            (
+                job_title,
+                city,
+                state,
+                posted_date,
+                distance,
+                job_summary,
+                position_overview,
+                score,
+                key_responsibilities,
+                required_qualifications,
+                preferred_certifications,
+                compensation_benefits,
+                work_schedule,
+                physical_requirements,
+                how_to_apply,
+                contact_emails,
+                contact_name,
+                contact_city,
+                contact_address,
+                contact_url,
+                source_url,
+            ) = [row[i] for i in columns]
+
+            suitability_score = None
+            if score:
+                try:
+                    suitability_score = int(score)
+                except ValueError:
+                    pass
 
-            distance = row.get("Distance to Harrogate, TN")
+            distance_miles = None
             if distance:
                 try:
-                    job["distance_to_harrogate_tn_miles"] = float(distance)
+                    distance_miles = float(distance)
                 except ValueError:
-                    job["distance_to_harrogate_tn_miles"] = None
-
-            jobs.append(job)
+                    pass
+
+            jobs.append(
+                {
+                    "job_title": job_title or "Tennis Role",
+                    "location": {
+                        "city": sys.intern(city or "Unknown City"),
+                        "state": sys.intern(state or "Unknown"),
+                    },
+                    "posted_date": sys.intern(posted_date),
+                    "distance_to_harrogate_tn_miles": distance_miles,
+                    "job_summary": job_summary,
+                    "position_overview": position_overview,
+                    "suitability_score": suitability_score,
+                    "key_responsibilities": key_responsibilities,
+                    "required_qualifications": required_qualifications,
+                    "preferred_certifications": preferred_certifications,
+                    "compensation_benefits": compensation_benefits,
+                    "work_schedule": work_schedule,
+                    "physical_requirements": physical_requirements,
+                    "how_to_apply": how_to_apply,
+                    "contact_emails": contact_emails,
+                    "contact_name": infer_contact_name(job_summary, contact_name, contact_url)
+                    or "Unknown org",
+                    "contact_city": sys.intern(contact_city),
+                    "contact_address": contact_address,
+                    "contact_url": contact_url,
+                    "source_url": source_url,
+                }
+            )
     return jobs
 
 
+def index_jobs_by_url(jobs):
+    index = {}
+    for job in jobs:
+        if job["source_url"]:
+            index.setdefault(job["source_url"], job)
+    return index
+
+
+def index_job_bytes(jobs):
+    # Each job's JSON, encoded once per load so API responses splice it in.
+    # Keyed by source_url like JOBS_BY_URL; entries hold their job so
+    # job_bytes can check the bytes belong to the dict it was given.
+    encoded = {}
+    for job in jobs:
+        source_url = job["source_url"]
+        if source_url and source_url not in encoded:
+            encoded[source_url] = (job, orjson.dumps(job))
+    return encoded
+
+
+def job_bytes(job):
+    entry = JOB_BYTES.get(job.get("source_url"))
+    if entry is not None and entry[0] is job:
+        return entry[1]
+    return orjson.dumps(job)
+
+
+def jobs_page_bytes(total, offset, limit, jobs):
+    """Serialized /api/jobs body, byte-identical to orjson.dumps of the payload dict."""
+    return b'{"total":%d,"offset":%d,"limit":%d,"jobs":[%b]}' % (
+        total,
+        offset,
+        limit,
+        b",".join(map(job_bytes, jobs)),
+    )
+
+
+def search_fields(job):
+    """Lowercased search text, lowercased location and parsed posted date for filter_jobs."""
+    location = job.get("location", {})
+    city = location.get("city")
+    state = location.get("state")
+    haystack = " ".join(
+        filter(
+            None,
+            [
+                job.get("job_title"),
+                job.get("job_summary"),
+                job.get("position_overview"),
+                job.get("how_to_apply"),
+                job.get("contact_name"),
+                city,
+                state,
+            ],
+        )
+    )
+    return (
+        normalize_text(haystack),
+        normalize_text(" ".join(filter(None, [city, state]))),
+        parse_date(job.get("posted_date") or ""),
+    )
+
+
+# The indexes below hold positions in the job list they were built from and
+# are stored alongside it, so filter_jobs only uses them for that list.
+
+
+def index_search_fields(jobs):
+    # Kept beside the jobs so the dicts served to clients stay free of derived fields.
+    return jobs, [search_fields(job) for job in jobs]
+
+
+def index_trigrams(jobs, fields):
+    """Map every 3-character slice of each job's search text to the positions of its jobs."""
+    index = defaultdict(set)
+    for position, (haystack, _, _) in enumerate(fields):
+        for trigram in {haystack[i : i + 3] for i in range(len(haystack) - 2)}:
+            index[trigram].add(position)
+    return jobs, dict(index)
+
+
+def trigram_candidates(jobs, q):
+    """Positions of jobs whose search text has every trigram of q, or None if unindexed."""
+    indexed_jobs, index = TRIGRAM_INDEX
+    if indexed_jobs is not jobs or len(q) < 3:
+        return None
+    postings = sorted(
+        (index.get(q[i : i + 3], frozenset()) for i in range(len(q) - 2)), key=len
+    )
+    return postings[0].intersection(*postings[1:])
+
+
+def index_posted_dates(jobs, fields):
+    """Posted dates in ascending order with the matching job positions; undated jobs are left out."""
+    dated = sorted(
+        (field[2], position) for position, field in enumerate(fields) if field[2] is not None
+    )
+    return jobs, [date for date, _ in dated], [position for _, position in dated]
+
+
+def date_candidates(jobs, posted_from, posted_to):
+    """Positions of jobs posted within [posted_from, posted_to], or None if unindexed."""
+    indexed_jobs, dates, positions = DATE_INDEX
+    if indexed_jobs is not jobs:
+        return None
+    lo = bisect.bisect_left(dates, posted_from) if posted_from else 0
+    hi = bisect.bisect_right(dates, posted_to) if posted_to else len(dates)
+    return set(positions[lo:hi])
+
+
+def index_scores(jobs):
+    """Fit scores in ascending order with the matching job positions; unscored jobs are left out."""
+    scored = sorted(
+        (job["suitability_score"], position)
+        for position, job in enumerate(jobs)
+        if isinstance(job["suitability_score"], int)
+    )
+    return jobs, [score for score, _ in scored], [position for _, position in scored]
+
+
+def score_candidates(jobs, min_score):
+    """Positions of jobs scored at least min_score, or None if unindexed."""
+    indexed_jobs, scores, positions = SCORE_INDEX
+    if indexed_jobs is not jobs:
+        return None
+    return set(positions[bisect.bisect_left(scores, min_score) :])
+
+
 ALL_JOBS = load_jobs()
+JOBS_BY_URL = index_jobs_by_url(ALL_JOBS)
+JOB_BYTES = index_job_bytes(ALL_JOBS)
+SEARCH_FIELDS = index_search_fields(ALL_JOBS)
+TRIGRAM_INDEX = index_trigrams(ALL_JOBS, SEARCH_FIELDS[1])
+DATE_INDEX = index_posted_dates(ALL_JOBS, SEARCH_FIELDS[1])
+SCORE_INDEX = index_scores(ALL_JOBS)
+# Bumped whenever ALL_JOBS is replaced so callers can invalidate derived caches.
+DATA_GENERATION = 0
 REFRESH_LOCK = threading.Lock()
+REFRESH_WAKE = threading.Event()
 LAST_REFRESH_TS = None
 
 
-def compute_stats(jobs):
+def compute_stats(jobs, fields=None):
+    if fields is None:
+        indexed_jobs, indexed_fields = SEARCH_FIELDS
+        fields = indexed_fields if indexed_jobs is jobs else None
     total = len(jobs)
-    scores = [j["suitability_score"] for j in jobs if isinstance(j["suitability_score"], int)]
-    avg_score = round(sum(scores) / len(scores), 1) if scores else None
-
-    state_counts = {}
-    for job in jobs:
-        state = job["location"]["state"] or "Unknown"
-        state_counts[state] = state_counts.get(state, 0) + 1
-    top_state = max(state_counts, key=state_counts.get) if state_counts else "Unknown"
-
+    score_sum = 0
+    score_count = 0
+    state_counts = Counter()
     latest_date = None
-    for job in jobs:
-        parsed = parse_date(job.get("posted_date"))
+    for position, job in enumerate(jobs):
+        score = job["suitability_score"]
+        if isinstance(score, int):
+            score_sum += score
+            score_count += 1
+        state_counts[job["location"]["state"] or "Unknown"] += 1
+        if fields is not None:
+            parsed = fields[position][2]
+        else:
+            parsed = parse_date(job.get("posted_date"))
         if parsed and (latest_date is None or parsed > latest_date):
             latest_date = parsed
+    avg_score = round(score_sum / score_count, 1) if score_count else None
+    top_state = state_counts.most_common(1)[0][0] if state_counts else "Unknown"
 
     return {
         "total": total,
@@ -219,14 +545,20 @@ def compute_stats(jobs):
 
 
 STATS = compute_stats(ALL_JOBS)
+# /api/stats body, serialized once per dataset instead of per request.
+STATS_BYTES = orjson.dumps(STATS)
 
 
 # ── Chatbot / Vector Store ──────────────────────────────────────────
 
 VS_CACHE_PATH = os.path.join(DATA_DIR, "chatbot_vs_cache.json")
+# Seconds to wait for OpenAI to finish indexing the uploaded data file.
+VS_INDEX_TIMEOUT = 120
 CHATBOT_DATA_PATH = os.path.join(DATA_DIR, "chatbot_jobs_data.txt")
-VECTOR_STORE_ID = None
-VS_READY = threading.Event()
+# (vector_store_id, ready_event), replaced as a whole so readers always see
+# an id and event from the same build. Writers hold VS_STATE_LOCK.
+VS_STATE = (None, threading.Event())
+VS_STATE_LOCK = threading.Lock()
 
 CHATBOT_SYSTEM_PROMPT = (
     "You are a friendly and knowledgeable tennis job market assistant for the "
@@ -252,72 +584,87 @@ CHATBOT_SYSTEM_PROMPT = (
 )
 
 
-def prepare_jobs_data_file():
-    """Create a structured text file from all job data for vector search."""
-    lines = [
-        "=== PRO TENNIS JOBS DATABASE ===",
-        f"Total Jobs: {len(ALL_JOBS)}",
-        f"Average Fit Score: {STATS.get('avgScore', 'N/A')}",
-        f"Top Hiring State: {STATS.get('topState', 'Unknown')}",
-        f"Most Recent Posting: {STATS.get('latestDate', 'Unknown')}",
-        "Data Source: protennisjobs.com",
-        "=" * 50,
-        "",
-    ]
+CHATBOT_TEXT_FIELDS = (
+    ("job_summary", "Summary"),
+    ("position_overview", "Position Overview"),
+    ("key_responsibilities", "Key Responsibilities"),
+    ("required_qualifications", "Required Qualifications"),
+    ("preferred_certifications", "Preferred Certifications"),
+    ("compensation_benefits", "Compensation & Benefits"),
+    ("work_schedule", "Work Schedule"),
+    ("physical_requirements", "Physical Requirements"),
+    ("how_to_apply", "How to Apply"),
+)
+SECTION_RULE = "=" * 50
+
 
-    for i, job in enumerate(ALL_JOBS, 1):
-        location = f"{job['location']['city']}, {job['location']['state']}"
-        lines.append(f"=== JOB LISTING #{i} ===")
-        lines.append(f"Title: {job.get('job_title', 'Unknown')}")
-        lines.append(f"Organization: {job.get('contact_name', 'Unknown')}")
-        lines.append(f"Location: {location}")
-        lines.append(f"Posted Date: {job.get('posted_date', 'Unknown')}")
-
-        score = job.get("suitability_score")
-        if score is not None:
-            lines.append(f"Fit Score: {score}/10")
-        distance = job.get("distance_to_harrogate_tn_miles")
-        if distance is not None:
-            lines.append(f"Distance to Harrogate, TN: {distance} miles")
-
-        lines.append("")
-
-        for field, label in [
-            ("job_summary", "Summary"),
-            ("position_overview", "Position Overview"),
-            ("key_responsibilities", "Key Responsibilities"),
-            ("required_qualifications", "Required Qualifications"),
-            ("preferred_certifications", "Preferred Certifications"),
-            ("compensation_benefits", "Compensation & Benefits"),
-            ("work_schedule", "Work Schedule"),
-            ("physical_requirements", "Physical Requirements"),
-            ("how_to_apply", "How to Apply"),
-        ]:
-            value = (job.get(field) or "").strip()
-            if value:
-                lines.append(f"{label}: {value}")
-
-        if job.get("contact_emails"):
-            lines.append(f"Contact Email: {job['contact_emails']}")
-        if job.get("contact_url"):
-            lines.append(f"Contact URL: {job['contact_url']}")
-        if job.get("source_url"):
-            lines.append(f"Source URL: {job['source_url']}")
-
-        lines.append("=" * 50)
-        lines.append("")
+def prepare_jobs_data_file():
+    """Create a structured text file from all job data for vector search.
 
+    Each listing is written as soon as it is formatted, so only one job's
+    text is held in memory at a time.
+    """
     with open(CHATBOT_DATA_PATH, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        write = f.write
+        write(
+            "=== PRO TENNIS JOBS DATABASE ===\n"
+            f"Total Jobs: {len(ALL_JOBS)}\n"
+            f"Average Fit Score: {STATS.get('avgScore', 'N/A')}\n"
+            f"Top Hiring State: {STATS.get('topState', 'Unknown')}\n"
+            f"Most Recent Posting: {STATS.get('latestDate', 'Unknown')}\n"
+            "Data Source: protennisjobs.com\n"
+            f"{SECTION_RULE}\n"
+        )
+
+        for i, job in enumerate(ALL_JOBS, 1):
+            location = f"{job['location']['city']}, {job['location']['state']}"
+            lines = [
+                "",
+                f"=== JOB LISTING #{i} ===",
+                f"Title: {job.get('job_title', 'Unknown')}",
+                f"Organization: {job.get('contact_name', 'Unknown')}",
+                f"Location: {location}",
+                f"Posted Date: {job.get('posted_date', 'Unknown')}",
+            ]
+
+            score = job.get("suitability_score")
+            if score is not None:
+                lines.append(f"Fit Score: {score}/10")
+            distance = job.get("distance_to_harrogate_tn_miles")
+            if distance is not None:
+                lines.append(f"Distance to Harrogate, TN: {distance} miles")
+
+            lines.append("")
+
+            for field, label in CHATBOT_TEXT_FIELDS:
+                value = (job.get(field) or "").strip()
+                if value:
+                    lines.append(f"{label}: {value}")
+
+            if job.get("contact_emails"):
+                lines.append(f"Contact Email: {job['contact_emails']}")
+            if job.get("contact_url"):
+                lines.append(f"Contact URL: {job['contact_url']}")
+            if job.get("source_url"):
+                lines.append(f"Source URL: {job['source_url']}")
+
+            lines.append(SECTION_RULE)
+            lines.append("")
+            write("\n".join(lines))
     return CHATBOT_DATA_PATH
 
 
 def compute_data_hash(filepath):
-    h = hashlib.sha256()
+    # Content fingerprint for the vector-store cache; prefixed so hashes
+    # from a different algorithm never match.
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        if hasattr(hashlib, "file_digest"):
+            h = hashlib.file_digest(f, "blake2b")
+        else:
+            h = hashlib.blake2b()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    return "blake2b:" + h.hexdigest()
 
 
 def load_vs_cache():
@@ -338,19 +685,28 @@ def save_vs_cache(data):
         pass
 
 
-def _vs_headers(content_type="application/json"):
-    headers = {
-        "Authorization": f"Bearer {OPENAI_API_KEY}",
-        "OpenAI-Beta": "assistants=v2",
-    }
-    if content_type:
-        headers["Content-Type"] = content_type
-    return headers
+def _delete_openai_resource(url, headers):
+    try:
+        OPENAI_SESSION.delete(url, headers=headers, timeout=10)
+    except requests.RequestException:
+        pass
+
+
+def publish_vector_store(vs_id, ready):
+    """Make vs_id live unless a refresh has started a newer build since."""
+    global VS_STATE
+    with VS_STATE_LOCK:
+        if VS_STATE[1] is not ready:
+            print(f"[chatbot] Discarding superseded vector store: {vs_id}")
+            return False
+        VS_STATE = (vs_id, ready)
+        ready.set()
+    return True
 
 
 def setup_vector_store():
     """Create or reuse an OpenAI Vector Store with current job data."""
-    global VECTOR_STORE_ID
+    ready = VS_STATE[1]
     if not OPENAI_API_KEY:
         print("[chatbot] OPENAI_API_KEY not set; vector store skipped.")
         return
@@ -364,46 +720,35 @@ def setup_vector_store():
     if cache.get("data_hash") == data_hash and cache.get("vector_store_id"):
         vs_id = cache["vector_store_id"]
         try:
-            resp = requests.get(
+            resp = OPENAI_SESSION.get(
                 f"https://api.openai.com/v1/vector_stores/{vs_id}",
-                headers=_vs_headers(),
+                headers=VS_HEADERS,
                 timeout=10,
             )
             if resp.status_code == 200:
-                VECTOR_STORE_ID = vs_id
-                VS_READY.set()
-                print(f"[chatbot] Reusing cached vector store: {vs_id}")
+                if publish_vector_store(vs_id, ready):
+                    print(f"[chatbot] Reusing cached vector store: {vs_id}")
                 return
         except requests.RequestException:
             pass
 
-    # Clean up previous resources
+    # Clean up previous resources; the two deletes are independent.
+    stale = []
     old_vs = cache.get("vector_store_id")
     if old_vs:
-        try:
-            requests.delete(
-                f"https://api.openai.com/v1/vector_stores/{old_vs}",
-                headers=_vs_headers(),
-                timeout=10,
-            )
-        except requests.RequestException:
-            pass
+        stale.append((f"https://api.openai.com/v1/vector_stores/{old_vs}", VS_HEADERS))
     old_file = cache.get("file_id")
     if old_file:
-        try:
-            requests.delete(
-                f"https://api.openai.com/v1/files/{old_file}",
-                headers={"Authorization": f"Bearer {OPENAI_API_KEY}"},
-                timeout=10,
-            )
-        except requests.RequestException:
-            pass
+        stale.append((f"https://api.openai.com/v1/files/{old_file}", OPENAI_AUTH_HEADERS))
+    if stale:
+        with ThreadPoolExecutor(max_workers=len(stale)) as executor:
+            list(executor.map(lambda args: _delete_openai_resource(*args), stale))
 
     # 1. Create vector store
     try:
-        resp = requests.post(
+        resp = OPENAI_SESSION.post(
             "https://api.openai.com/v1/vector_stores",
-            headers=_vs_headers(),
+            headers=VS_HEADERS,
             json={"name": "Pro Tennis Jobs Data"},
             timeout=15,
         )
@@ -417,9 +762,9 @@ def setup_vector_store():
     # 2. Upload data file
     try:
         with open(data_path, "rb") as f:
-            resp = requests.post(
+            resp = OPENAI_SESSION.post(
                 "https://api.openai.com/v1/files",
-                headers={"Authorization": f"Bearer {OPENAI_API_KEY}"},
+                headers=OPENAI_AUTH_HEADERS,
                 files={"file": ("protennisjobs_data.txt", f, "text/plain")},
                 data={"purpose": "assistants"},
                 timeout=60,
@@ -433,9 +778,9 @@ def setup_vector_store():
 
     # 3. Attach file to vector store
     try:
-        resp = requests.post(
+        resp = OPENAI_SESSION.post(
             f"https://api.openai.com/v1/vector_stores/{vs_id}/files",
-            headers=_vs_headers(),
+            headers=VS_HEADERS,
             json={"file_id": file_id},
             timeout=15,
         )
@@ -445,12 +790,14 @@ def setup_vector_store():
         print(f"[chatbot] Failed to attach file: {exc}")
         return
 
-    # 4. Poll until indexing completes
-    for _ in range(60):
+    # 4. Poll until indexing completes, backing off from 0.5s up to 4s
+    deadline = time.monotonic() + VS_INDEX_TIMEOUT
+    delay = 0.5
+    while True:
         try:
-            resp = requests.get(
+            resp = OPENAI_SESSION.get(
                 f"https://api.openai.com/v1/vector_stores/{vs_id}/files/{file_id}",
-                headers=_vs_headers(),
+                headers=VS_HEADERS,
                 timeout=10,
             )
             if resp.status_code == 200:
@@ -462,13 +809,17 @@ def setup_vector_store():
                     return
         except requests.RequestException:
             pass
-        time.sleep(2)
-    else:
-        print("[chatbot] File indexing timed out.")
-        return
+        if time.monotonic() + delay > deadline:
+            print("[chatbot] File indexing timed out.")
+            return
+        time.sleep(delay)
+        delay = min(delay * 2, 4.0)
 
-    VECTOR_STORE_ID = vs_id
-    VS_READY.set()
+    if not publish_vector_store(vs_id, ready):
+        # Nothing references this build, so don't leave it behind.
+        _delete_openai_resource(f"https://api.openai.com/v1/vector_stores/{vs_id}", VS_HEADERS)
+        _delete_openai_resource(f"https://api.openai.com/v1/files/{file_id}", OPENAI_AUTH_HEADERS)
+        return
     save_vs_cache(
         {
             "vector_store_id": vs_id,
@@ -480,15 +831,63 @@ def setup_vector_store():
     print(f"[chatbot] Vector store ready: {vs_id}")
 
 
+class TTLCache:
+    """Thread-safe LRU whose entries also expire after ttl seconds.
+
+    Holds OpenAI results here and serialized pages in api/jobs.py.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+def openai_cache_key(*parts):
+    return hashlib.blake2b(orjson.dumps(parts), digest_size=16).digest()
+
+
+CHAT_CACHE_SIZE = 512
+CHAT_CACHE_TTL = 600.0
+# Keyed by (model, vector store id, messages). The vector store id changes on
+# every rebuild, so stale answers are never served.
+CHAT_CACHE = TTLCache(CHAT_CACHE_SIZE, CHAT_CACHE_TTL)
+
+
 def chat_with_data(messages):
     """Send a chat request to OpenAI Responses API with file search."""
     if not OPENAI_API_KEY:
         raise RuntimeError("OPENAI_API_KEY is missing.")
 
-    if not VS_READY.wait(timeout=30):
-        raise RuntimeError(
-            "The job data index is still being prepared. Please try again in a moment."
-        )
+    vs_id, ready = VS_STATE
+    if vs_id is None:
+        # Re-read after waiting: a refresh may have swapped in a new build.
+        if ready.wait(timeout=30):
+            vs_id = VS_STATE[0]
+        if vs_id is None:
+            raise RuntimeError(
+                "The job data index is still being prepared. Please try again in a moment."
+            )
 
     input_messages = []
     for msg in messages:
@@ -500,6 +899,11 @@ def chat_with_data(messages):
     if not input_messages:
         raise RuntimeError("No messages provided.")
 
+    cache_key = openai_cache_key(OPENAI_CHAT_MODEL, vs_id, input_messages)
+    cached = CHAT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     payload = {
         "model": OPENAI_CHAT_MODEL,
         "instructions": CHATBOT_SYSTEM_PROMPT,
@@ -507,7 +911,7 @@ def chat_with_data(messages):
         "tools": [
             {
                 "type": "file_search",
-                "vector_store_ids": [VECTOR_STORE_ID],
+                "vector_store_ids": [vs_id],
             }
         ],
         "temperature": 0.4,
@@ -516,12 +920,9 @@ def chat_with_data(messages):
     }
 
     try:
-        resp = requests.post(
+        resp = OPENAI_SESSION.post(
             OPENAI_API_URL,
-            headers={
-                "Authorization": f"Bearer {OPENAI_API_KEY}",
-                "Content-Type": "application/json",
-            },
+            headers=OPENAI_JSON_HEADERS,
             json=payload,
             timeout=60,
         )
@@ -532,10 +933,11 @@ def chat_with_data(messages):
             msg = f"OpenAI error: {exc.response.status_code} {exc.response.text}"
         raise RuntimeError(msg) from exc
 
-    data = resp.json()
+    data = orjson.loads(resp.content)
     text = extract_openai_text(data)
     if not text:
         raise RuntimeError("Empty response from assistant.")
+    CHAT_CACHE.put(cache_key, text)
     return text
 
 
@@ -552,41 +954,53 @@ def filter_jobs(jobs, query):
         except ValueError:
             min_score = None
 
+    # Unfiltered listing (the landing page): callers only slice the result,
+    # so hand back the list itself instead of copying it job by job.
+    if not (q or location_filter or posted_from or posted_to or min_score is not None):
+        return jobs
+
+    # Narrow to the jobs that can match before checking each one: text queries
+    # of 3+ characters via the trigram index, date and score ranges via bisect.
+    # The date and score indexes match exactly, so when they cover every
+    # active filter the candidates are the answer and the scan is skipped.
+    has_dates = bool(posted_from or posted_to)
+    has_score = min_score is not None
+    candidates = None
+    exact = not (q or location_filter)
+    for active, narrowed in (
+        (bool(q), trigram_candidates(jobs, q) if q else None),
+        (has_dates, date_candidates(jobs, posted_from, posted_to) if has_dates else None),
+        (has_score, score_candidates(jobs, min_score) if has_score else None),
+    ):
+        if narrowed is not None:
+            candidates = narrowed if candidates is None else candidates & narrowed
+        elif active:
+            exact = False
+    if candidates is not None:
+        positions = sorted(candidates)
+        if exact:
+            return [jobs[position] for position in positions]
+    else:
+        positions = range(len(jobs))
+
+    indexed_jobs, indexed_fields = SEARCH_FIELDS
+    fields = indexed_fields if indexed_jobs is jobs else None
+
+    # Cheapest checks first so the substring scans only see surviving jobs.
     filtered = []
-    for job in jobs:
-        if q:
-            haystack = " ".join(
-                filter(
-                    None,
-                    [
-                        job.get("job_title"),
-                        job.get("job_summary"),
-                        job.get("position_overview"),
-                        job.get("how_to_apply"),
-                        job.get("contact_name"),
-                        job.get("location", {}).get("city"),
-                        job.get("location", {}).get("state"),
-                    ],
-                )
-            )
-            if q not in normalize_text(haystack):
+    for position in positions:
+        job = jobs[position]
+        if min_score is not None:
+            score = job.get("suitability_score")
+            if not isinstance(score, int) or score < min_score:
                 continue
 
-        if location_filter:
-            location = " ".join(
-                filter(
-                    None,
-                    [
-                        job.get("location", {}).get("city"),
-                        job.get("location", {}).get("state"),
-                    ],
-                )
-            )
-            if location_filter not in normalize_text(location):
-                continue
+        if fields is not None:
+            haystack, location, posted_date = fields[position]
+        else:
+            haystack, location, posted_date = search_fields(job)
 
         if posted_from or posted_to:
-            posted_date = parse_date(job.get("posted_date") or "")
             if not posted_date:
                 continue
             if posted_from and posted_date < posted_from:
@@ -594,10 +1008,11 @@ def filter_jobs(jobs, query):
             if posted_to and posted_date > posted_to:
                 continue
 
-        if min_score is not None:
-            score = job.get("suitability_score")
-            if not isinstance(score, int) or score < min_score:
-                continue
+        if location_filter and location_filter not in location:
+            continue
+
+        if q and q not in haystack:
+            continue
 
         filtered.append(job)
 
@@ -608,6 +1023,8 @@ def find_job_by_source_url(jobs, source_url):
     if not source_url:
         return None
     source_url = source_url.strip()
+    if jobs is ALL_JOBS:
+        return JOBS_BY_URL.get(source_url)
     for job in jobs:
         if job.get("source_url") == source_url:
             return job
@@ -615,7 +1032,8 @@ def find_job_by_source_url(jobs, source_url):
 
 
 def refresh_dataset():
-    global ALL_JOBS, STATS, LAST_REFRESH_TS, VECTOR_STORE_ID
+    global ALL_JOBS, JOBS_BY_URL, JOB_BYTES, SEARCH_FIELDS, TRIGRAM_INDEX, DATE_INDEX, SCORE_INDEX
+    global STATS, STATS_BYTES, LAST_REFRESH_TS, VS_STATE, DATA_GENERATION
     if not REFRESH_LOCK.acquire(blocking=False):
         return False
     try:
@@ -623,12 +1041,30 @@ def refresh_dataset():
 
         print("Refreshing job listings from protennisjobs.com...")
         scraper.main()
-        ALL_JOBS = load_jobs()
-        STATS = compute_stats(ALL_JOBS)
+        jobs = load_jobs()
+        # Build every derived structure before publishing so readers never
+        # pair the new job list with old stats or indexes.
+        jobs_by_url = index_jobs_by_url(jobs)
+        encoded = index_job_bytes(jobs)
+        search = index_search_fields(jobs)
+        trigrams = index_trigrams(jobs, search[1])
+        dates = index_posted_dates(jobs, search[1])
+        scores = index_scores(jobs)
+        stats = compute_stats(jobs, search[1])
+        JOBS_BY_URL = jobs_by_url
+        JOB_BYTES = encoded
+        SEARCH_FIELDS = search
+        TRIGRAM_INDEX = trigrams
+        DATE_INDEX = dates
+        SCORE_INDEX = scores
+        STATS = stats
+        STATS_BYTES = orjson.dumps(stats)
+        ALL_JOBS = jobs
+        DATA_GENERATION += 1
         LAST_REFRESH_TS = time.time()
         # Rebuild chatbot vector store with new data
-        VS_READY.clear()
-        VECTOR_STORE_ID = None
+        with VS_STATE_LOCK:
+            VS_STATE = (None, threading.Event())
         threading.Thread(target=setup_vector_store, daemon=True).start()
         print("Refresh complete.")
         return True
@@ -646,7 +1082,10 @@ def refresh_loop():
     interval_seconds = max(0.5, REFRESH_INTERVAL_DAYS * 86400)
     refresh_dataset()
     while True:
-        time.sleep(interval_seconds)
+        # Up to 5% jitter keeps instances started together from scraping in lockstep.
+        # POST /api/refresh sets REFRESH_WAKE to run the next refresh right away.
+        REFRESH_WAKE.wait(interval_seconds + random.uniform(0, interval_seconds * REFRESH_JITTER))
+        REFRESH_WAKE.clear()
         refresh_dataset()
 
 
@@ -671,8 +1110,8 @@ def parse_json_from_text(text):
     text = text.strip()
     if text.startswith("{") and text.endswith("}"):
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
             return None
     # Try to extract the first JSON object
     start = text.find("{")
@@ -680,8 +1119,8 @@ def parse_json_from_text(text):
     if start != -1 and end != -1 and end > start:
         snippet = text[start : end + 1]
         try:
-            return json.loads(snippet)
-        except json.JSONDecodeError:
+            return orjson.loads(snippet)
+        except orjson.JSONDecodeError:
             return None
     return None
 
@@ -743,11 +1182,23 @@ def build_email_prompt(job, user_context):
     return content
 
 
+DRAFT_CACHE_SIZE = int(os.getenv("PTJ_DRAFT_CACHE_SIZE", "256"))
+DRAFT_CACHE_TTL = 600.0
+# Keyed by (model, prompt); the prompt embeds the job details and user context,
+# so a refreshed listing gets a fresh draft.
+DRAFT_CACHE = TTLCache(DRAFT_CACHE_SIZE, DRAFT_CACHE_TTL)
+
+
 def request_email_draft(job, user_context=""):
     if not OPENAI_API_KEY:
         raise RuntimeError("OPENAI_API_KEY is missing.")
 
     prompt = build_email_prompt(job, user_context)
+    cache_key = openai_cache_key(OPENAI_MODEL, prompt)
+    cached = DRAFT_CACHE.get(cache_key)
+    if cached is not None:
+        subject, body = cached
+        return {"subject": subject, "body": body}
     debug_prompt_path = os.path.join(DATA_DIR, "last_email_prompt.txt")
     try:
         with open(debug_prompt_path, "w", encoding="utf-8") as file:
@@ -771,12 +1222,9 @@ def request_email_draft(job, user_context=""):
         "max_output_tokens": 400,
     }
     try:
-        response = requests.post(
+        response = OPENAI_SESSION.post(
             OPENAI_API_URL,
-            headers={
-                "Authorization": f"Bearer {OPENAI_API_KEY}",
-                "Content-Type": "application/json",
-            },
+            headers=OPENAI_JSON_HEADERS,
             json=payload,
             timeout=40,
         )
@@ -787,7 +1235,7 @@ def request_email_draft(job, user_context=""):
             message = f"OpenAI request failed: {exc.response.status_code} {exc.response.text}"
         raise RuntimeError(message) from exc
 
-    data = response.json()
+    data = orjson.loads(response.content)
     text = extract_openai_text(data)
     if not text:
         raise RuntimeError("Empty response from OpenAI.")
@@ -802,72 +1250,152 @@ def request_email_draft(job, user_context=""):
             subject = f"Application for {fallback_title}"
         if not body:
             raise RuntimeError("Incomplete draft from OpenAI.")
+    DRAFT_CACHE.put(cache_key, (subject, body))
     return {"subject": subject, "body": body}
 
 
+PAGING_KEYS = frozenset({"offset", "limit"})
+# Upper bound on page size so one request can't serialize the whole dataset.
+MAX_PAGE_LIMIT = 100
+
+
+def parse_paging(query):
+    """Clamped (offset, limit) from an /api/jobs query, or None if either isn't an integer.
+
+    Both the local server and api/jobs.py go through this, which also keeps
+    the page caches keyed on a bounded set of (offset, limit) pairs.
+    """
+    try:
+        offset = int(query.get("offset", [0])[0])
+        limit = int(query.get("limit", [6])[0])
+    except ValueError:
+        return None
+    return max(offset, 0), min(max(limit, 0), MAX_PAGE_LIMIT)
+
+
+# Bodies smaller than this grow or barely shrink when gzipped.
+GZIP_MIN_SIZE = 512
+
+
+def gzip_body(data):
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+
+def make_etag(data):
+    """ETag for an uncompressed JSON body."""
+    return f'"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'
+
+
+def gzip_etag(etag):
+    # The gzipped body is a different representation, so it gets its own tag.
+    return etag[:-1] + '-gz"'
+
+
+def cached_response(data):
+    """(body, etag, gzipped body or None) for a body that will be served repeatedly.
+
+    Callers keep the tuple in their own cache so hits skip hashing and
+    compression entirely.
+    """
+    gzipped = gzip_body(data) if len(data) >= GZIP_MIN_SIZE else None
+    return data, make_etag(data), gzipped
+
+
+@functools.lru_cache(maxsize=64)
+def unfiltered_jobs_page(generation, offset, limit):
+    """cached_response for an /api/jobs page with no filters (e.g. the landing page).
+
+    generation is DATA_GENERATION, so a refresh naturally misses the old entries.
+    """
+    jobs = ALL_JOBS
+    data = jobs_page_bytes(len(jobs), offset, limit, jobs[offset : offset + limit])
+    return cached_response(data)
+
+
+# Seconds browsers may reuse a cacheable response before revalidating.
+CACHE_MAX_AGE = 30
+
+
 class Handler(SimpleHTTPRequestHandler):
+    # Keep connections open between requests (every response carries a
+    # Content-Length); idle sockets are dropped after KEEPALIVE_TIMEOUT.
+    protocol_version = "HTTP/1.1"
+    timeout = KEEPALIVE_TIMEOUT
+    # Headers and body go out as two writes; with Nagle on, the body can sit
+    # behind the client's delayed ACK of the header segment.
+    disable_nagle_algorithm = True
+
     def do_GET(self):
-        parsed = urlparse(self.path)
-        if parsed.path == "/api/job":
-            query = parse_qs(parsed.query)
-            source_url = query.get("source_url", [""])[0]
-            job = find_job_by_source_url(ALL_JOBS, source_url)
-            if not job:
-                self._send_json({"error": "Job not found."}, status=404)
-                return
-            self._send_json(job)
+        path, _, query_string = self.path.partition("?")
+        route = self.GET_ROUTES.get(path)
+        if route is None:
+            return super().do_GET()
+        route(self, query_string)
+
+    def do_POST(self):
+        route = self.POST_ROUTES.get(self.path.partition("?")[0])
+        if route is None:
+            # The body is never read here, so the connection can't be reused.
+            self.close_connection = True
+            self._send_json({"error": "Not found."}, status=404)
             return
-        if parsed.path == "/api/email-draft":
-            query = parse_qs(parsed.query)
-            source_url = query.get("source_url", [""])[0]
-            user_context = query.get("user_context", [""])[0]
-            job = find_job_by_source_url(ALL_JOBS, source_url)
-            if not job:
-                self._send_json({"error": "Job not found."}, status=404)
-                return
-            email = job.get("contact_emails") or ""
-            if not email:
-                self._send_json({"error": "No contact email for this job."}, status=400)
-                return
-            try:
-                draft = request_email_draft(job, user_context=user_context)
-            except Exception as exc:
-                self._send_json({"error": str(exc)}, status=500)
-                return
-            payload = {
-                "to": email,
-                "subject": draft["subject"],
-                "body": draft["body"],
-            }
-            self._send_json(payload)
+        route(self)
+
+    def _get_job(self, query_string):
+        query = parse_qs(query_string)
+        source_url = query.get("source_url", [""])[0]
+        job = find_job_by_source_url(ALL_JOBS, source_url)
+        if not job:
+            self._send_json({"error": "Job not found."}, status=404)
             return
-        if parsed.path == "/api/jobs":
-            query = parse_qs(parsed.query)
-            offset = int(query.get("offset", [0])[0])
-            limit = int(query.get("limit", [6])[0])
-            filtered_jobs = filter_jobs(ALL_JOBS, query)
-            sliced = filtered_jobs[offset : offset + limit]
-            payload = {
-                "total": len(filtered_jobs),
-                "offset": offset,
-                "limit": limit,
-                "jobs": sliced,
-            }
-            self._send_json(payload)
+        data = job_bytes(job)
+        self._send_bytes(data, etag=make_etag(data))
+
+    def _get_email_draft(self, query_string):
+        query = parse_qs(query_string)
+        source_url = query.get("source_url", [""])[0]
+        user_context = query.get("user_context", [""])[0]
+        job = find_job_by_source_url(ALL_JOBS, source_url)
+        if not job:
+            self._send_json({"error": "Job not found."}, status=404)
             return
-        if parsed.path == "/api/stats":
-            self._send_json(STATS)
+        email = job.get("contact_emails") or ""
+        if not email:
+            self._send_json({"error": "No contact email for this job."}, status=400)
+            return
+        try:
+            draft = request_email_draft(job, user_context=user_context)
+        except Exception as exc:
+            self._send_json({"error": str(exc)}, status=500)
             return
-        return super().do_GET()
+        payload = {
+            "to": email,
+            "subject": draft["subject"],
+            "body": draft["body"],
+        }
+        self._send_json(payload)
 
-    def do_POST(self):
-        parsed = urlparse(self.path)
-        if parsed.path == "/api/chat":
-            self._handle_chat()
+    def _get_jobs(self, query_string):
+        query = parse_qs(query_string)
+        paging = parse_paging(query)
+        if paging is None:
+            self._send_json({"error": "Invalid offset or limit."}, status=400)
             return
-        if parsed.path != "/api/email-draft":
-            self._send_json({"error": "Not found."}, status=404)
+        offset, limit = paging
+        # Pages past the end are empty and not worth a cache slot.
+        if query.keys() <= PAGING_KEYS and offset < len(ALL_JOBS):
+            data, etag, gzipped = unfiltered_jobs_page(DATA_GENERATION, offset, limit)
+            self._send_bytes(data, etag=etag, gzipped=gzipped)
             return
+        filtered_jobs = filter_jobs(ALL_JOBS, query)
+        sliced = filtered_jobs[offset : offset + limit]
+        data = jobs_page_bytes(len(filtered_jobs), offset, limit, sliced)
+        self._send_bytes(data, etag=make_etag(data))
+
+    def _get_stats(self, query_string):
+        self._send_bytes(STATS_BYTES, etag=make_etag(STATS_BYTES))
+
+    def _post_email_draft(self):
         print(f"[email-draft] POST {self.path}")
         try:
             length = int(self.headers.get("Content-Length", "0") or "0")
@@ -875,8 +1403,8 @@ class Handler(SimpleHTTPRequestHandler):
             length = 0
         body = self.rfile.read(length) if length > 0 else b""
         try:
-            payload = json.loads(body.decode("utf-8") or "{}")
-        except json.JSONDecodeError:
+            payload = orjson.loads(body or b"{}")
+        except orjson.JSONDecodeError:
             print("[email-draft] Invalid JSON body.")
             self._send_json({"error": "Invalid JSON body."}, status=400)
             return
@@ -910,15 +1438,48 @@ class Handler(SimpleHTTPRequestHandler):
         }
         self._send_json(response_payload)
 
-    def _handle_chat(self):
+    def _post_refresh(self):
+        try:
+            length = int(self.headers.get("Content-Length", "0") or "0")
+        except ValueError:
+            length = 0
+        if length > 0:
+            self.rfile.read(length)
+        if not self._refresh_allowed():
+            self._send_json({"error": "Refresh not allowed."}, status=403)
+            return
+        if not REFRESH_ENABLED:
+            self._send_json({"error": "Auto refresh is disabled."}, status=409)
+            return
+        # Setting the event mid-refresh would queue a second full scrape right after.
+        if REFRESH_LOCK.locked():
+            self._send_json({"error": "A refresh is already running."}, status=409)
+            return
+        REFRESH_WAKE.set()
+        self._send_json({"status": "scheduled"}, status=202)
+
+    def _refresh_allowed(self):
+        """Refreshes run full scrapes and OpenAI scoring: loopback or PTJ_REFRESH_TOKEN only."""
+        if REFRESH_TOKEN:
+            auth = self.headers.get("Authorization", "")
+            if hmac.compare_digest(auth.encode(), f"Bearer {REFRESH_TOKEN}".encode()):
+                return True
+        try:
+            address = ipaddress.ip_address(self.client_address[0])
+        except ValueError:
+            return False
+        mapped = getattr(address, "ipv4_mapped", None)
+        return (mapped or address).is_loopback
+
+    def _post_chat(self):
         try:
             length = int(self.headers.get("Content-Length", "0") or "0")
         except ValueError:
             length = 0
         body = self.rfile.read(length) if length > 0 else b""
         try:
-            payload = json.loads(body.decode("utf-8") or "{}")
-        except json.JSONDecodeError:
+            payload = orjson.loads(body or b"{}")
+        except orjson.JSONDecodeError:
             self._send_json({"error": "Invalid JSON body."}, status=400)
             return
         messages = payload.get("messages", [])
@@ -933,15 +1494,73 @@ class Handler(SimpleHTTPRequestHandler):
             return
         self._send_json({"response": response_text})
 
+    GET_ROUTES = {
+        "/api/job": _get_job,
+        "/api/email-draft": _get_email_draft,
+        "/api/jobs": _get_jobs,
+        "/api/stats": _get_stats,
+    }
+    POST_ROUTES = {
+        "/api/chat": _post_chat,
+        "/api/email-draft": _post_email_draft,
+        "/api/refresh": _post_refresh,
+    }
+
+    def copyfile(self, source, outputfile):
+        # Static files: let the kernel copy straight from the page cache to
+        # the socket (socket.sendfile falls back to send() where unsupported).
+        if outputfile is self.wfile:
+            self.connection.sendfile(source)
+        else:
+            super().copyfile(source, outputfile)
+
     def _send_json(self, payload, status=200):
-        data = json.dumps(payload).encode("utf-8")
+        self._send_bytes(orjson.dumps(payload), status=status)
+
+    def _send_bytes(self, data, status=200, etag=None, gzipped=None):
+        """Write a JSON body, gzipped when it pays off.
+
+        Pass etag (from make_etag) to make the response cacheable; a matching
+        If-None-Match then gets a 304. gzipped is an already-compressed body
+        from cached_response, used instead of compressing again.
+        """
+        use_gzip = (
+            status == 200
+            and len(data) >= GZIP_MIN_SIZE
+            and "gzip" in self.headers.get("Accept-Encoding", "")
+        )
+        if use_gzip:
+            data = gzipped if gzipped is not None else gzip_body(data)
+            if etag is not None:
+                etag = gzip_etag(etag)
+        if etag is not None and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", f"public, max-age={CACHE_MAX_AGE}")
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
         self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Vary", "Accept-Encoding")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", f"public, max-age={CACHE_MAX_AGE}")
         self.send_header("Content-Length", str(len(data)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
         self.end_headers()
         self.wfile.write(data)
 
 
+class AppServer(ThreadingHTTPServer):
+    # Handler threads spend most of their time blocked on OpenAI round-trips;
+    # a deeper accept backlog keeps bursts from being refused at the socket.
+    request_queue_size = 64
+
+
 if __name__ == "__main__":
     ensure_single_instance()
     os.chdir(WEB_DIR)
@@ -950,7 +1569,7 @@ if __name__ == "__main__":
         threading.Thread(target=refresh_loop, daemon=True).start()
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8000"))
-    server = ThreadingHTTPServer((host, port), Handler)
+    server = AppServer((host, port), Handler)
     print(f"Serving on http://{host}:{port}")
     print(f"Open in browser: http://localhost:{port}/")
     server.serve_forever()
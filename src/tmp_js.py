@@ -9,8 +9,11 @@ urls = [
     "https://protennisjobs.com/index.php?js=upm_image",
 ]
 
+session = requests.Session()
+session.headers.update({"User-Agent": "Mozilla/5.0"})
+
 for url in urls:
-    resp = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
+    resp = session.get(url)
     text = resp.text
     if any(k in text.lower() for k in ["contact", "email", "apply", "classified", "job"]):
         hits = sorted(set(re.findall(r"https?://[^'\"\s]+", text)))
@@ -0,0 +1,31 @@
+import os
+import sys
+import unittest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(TESTS_DIR), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import scrape_protennisjobs as scraper  # noqa: E402
+
+
+class ParseScoresTest(unittest.TestCase):
+    def test_integer_ids(self):
+        text = '{"scores": [{"id": 1, "score": 7}, {"id": 2, "score": 3}]}'
+        self.assertEqual(scraper.parse_scores_from_text(text, 2), [7, 3])
+
+    def test_numeric_string_ids(self):
+        text = 'Here you go: {"scores": [{"id": "2", "score": 9}, {"id": " 1 ", "score": 4}]}'
+        self.assertEqual(scraper.parse_scores_from_text(text, 2), [4, 9])
+
+    def test_bad_and_out_of_range_ids_are_skipped(self):
+        text = '{"scores": [{"id": "x", "score": 5}, {"id": 3, "score": 5}, {"score": 5}, {"id": 1, "score": 12}]}'
+        self.assertEqual(scraper.parse_scores_from_text(text, 2), [10, None])
+
+    def test_unparseable_text(self):
+        self.assertEqual(scraper.parse_scores_from_text("no json here", 3), [None, None, None])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(TESTS_DIR), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import scrape_protennisjobs as scraper  # noqa: E402
+
+US_CITIES_CSV = (
+    "city,state_id,state_name,lat,lng\n"
+    "Lexington,KY,Kentucky,38.0423,-84.4587\n"
+    "Austin,TX,Texas,30.3005,-97.7522\n"
+)
+
+
+class OfflineGazetteerTest(unittest.TestCase):
+    def setUp(self):
+        handle, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w", encoding="utf-8") as out:
+            out.write(US_CITIES_CSV)
+        self.addCleanup(os.remove, path)
+        patcher = mock.patch.object(scraper, "US_CITIES_FILE", path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        scraper.load_us_cities.cache_clear()
+        self.addCleanup(scraper.load_us_cities.cache_clear)
+
+    def test_full_state_name_resolves_without_network(self):
+        with mock.patch.object(scraper.GEOCODE_SESSION, "get") as get:
+            coords = scraper.geocode_city_state("Lexington", "Kentucky", {})
+        self.assertEqual(coords, (38.0423, -84.4587))
+        get.assert_not_called()
+
+    def test_state_code_still_resolves(self):
+        with mock.patch.object(scraper.GEOCODE_SESSION, "get") as get:
+            coords = scraper.geocode_city_state("Austin", "TX", {})
+        self.assertEqual(coords, (30.3005, -97.7522))
+        get.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import orjson
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(TESTS_DIR), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import scrape_protennisjobs as scraper  # noqa: E402
+
+
+class CacheFileTest(unittest.TestCase):
+    """Base for tests that point one of the scraper's JSON cache files at a temp path."""
+
+    cache_attr = None
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, "cache.json")
+        patcher = mock.patch.object(scraper, self.cache_attr, self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def read_saved(self):
+        with open(self.path, "rb") as handle:
+            return orjson.loads(handle.read())
+
+
+class JobDetailsCacheTest(CacheFileTest):
+    cache_attr = "JOB_DETAILS_CACHE_FILE"
+
+    def test_save_drops_expired_listings(self):
+        cache = {
+            "https://example.com/live": {"fingerprint": ["a"], "job": {}},
+            "https://example.com/expired": {"fingerprint": ["b"], "job": {}},
+        }
+        scraper.save_job_details_cache(cache, {"https://example.com/live"})
+        self.assertEqual(list(self.read_saved()), ["https://example.com/live"])
+
+
+class HttpCacheTest(CacheFileTest):
+    cache_attr = "HTTP_CACHE_FILE"
+
+    def setUp(self):
+        super().setUp()
+        with open(self.path, "wb") as handle:
+            handle.write(
+                orjson.dumps(
+                    {
+                        url: {"etag": '"v1"', "last_modified": None, "text": url}
+                        for url in ("fetched", "live", "expired", "old-page")
+                    }
+                )
+            )
+        for name in ("HTTP_CACHE", "HTTP_CACHE_USED"):
+            patcher = mock.patch.object(scraper, name, type(getattr(scraper, name))())
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        scraper.load_http_cache()
+
+    def test_unchanged_page_is_served_from_cache(self):
+        response = mock.Mock(status_code=304, headers={})
+        with mock.patch.object(scraper.SESSION, "get", return_value=response) as get, \
+                mock.patch.object(scraper, "SCRAPE_MAX_RPS", 0):
+            self.assertEqual(scraper.get_page_text("fetched", None), "fetched")
+        self.assertEqual(get.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+
+    def test_save_keeps_only_fetched_and_live_urls(self):
+        with mock.patch.object(scraper.SESSION, "get", return_value=mock.Mock(status_code=304)), \
+                mock.patch.object(scraper, "SCRAPE_MAX_RPS", 0):
+            scraper.get_page_text("fetched", None)
+        scraper.save_http_cache({"live"})
+        self.assertEqual(sorted(self.read_saved()), ["fetched", "live"])
+
+
+class FitScoreCacheTest(CacheFileTest):
+    cache_attr = "FIT_SCORE_CACHE_FILE"
+
+    def test_save_keeps_only_current_prompts(self):
+        job = scraper.JobListing(**{name: None for name in scraper.JobListing.__dataclass_fields__})
+        job.job_title = "Head Pro"
+        key = scraper.fit_cache_key(scraper.build_fit_prompt(job))
+        with open(self.path, "wb") as handle:
+            handle.write(
+                orjson.dumps({key: 8, "https://example.com/old-url-key": 5, "stalehash": 3})
+            )
+        with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test"}), mock.patch.object(
+            scraper, "fetch_openai_scores"
+        ) as fetch:
+            scraper.score_jobs_with_ai([job])
+        fetch.assert_not_called()
+        self.assertEqual(job.suitability_score, 8)
+        self.assertEqual(self.read_saved(), {key: 8})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import sys
+import unittest
+from dataclasses import asdict
+from unittest import mock
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(TESTS_DIR), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import scrape_protennisjobs as scraper  # noqa: E402
+
+DETAIL_PAGE = os.path.join(TESTS_DIR, "fixtures", "detail_page.html")
+JOB_URL = "https://protennisjobs.com/tennis-jobs/25001/head-tennis-professional"
+
+
+class ExtractJobDetailsTest(unittest.TestCase):
+    """Pins what extract_job_details reads from a saved detail page.
+
+    The page keeps its contact email only in a <section class="entry-content">
+    and wraps everything in <main>/<article>, which a tag-name strainer drops.
+    """
+
+    def extract(self):
+        with open(DETAIL_PAGE, encoding="utf-8") as handle:
+            page = handle.read()
+        with mock.patch.object(scraper, "get_page_text", return_value=page):
+            return scraper.extract_job_details(
+                JOB_URL,
+                "Lakeside Racquet Club is looking for a Head Tennis Professional.",
+                "Head Tennis Professional",
+                "Madison, WI",
+                "03 February 2026",
+            )
+
+    def test_detail_page_fields(self):
+        self.assertEqual(
+            asdict(self.extract()),
+            {
+                "job_title": "Head Tennis Professional & Director",
+                "location": {"city": "Madison", "state": "WI"},
+                "posted_date": "03 February 2026",
+                "job_summary": "Lakeside Racquet Club is looking for a Head Tennis Professional.",
+                "position_overview": "We are a member-owned club with 12 hard courts and 4 clay courts.",
+                "suitability_score": None,
+                "key_responsibilities": (
+                    "Run adult and junior programming Teach private and semi-private lessons"
+                ),
+                "required_qualifications": (
+                    "A PTR or USPTA certification and three years of teaching are needed."
+                ),
+                "preferred_certifications": None,
+                "compensation_benefits": (
+                    "Competitive base pay plus lesson revenue and a full health package."
+                ),
+                "work_schedule": None,
+                "physical_requirements": None,
+                "how_to_apply": "Send a cover letter and resume through the link below.",
+                "contact_emails": "careers@lakesiderc.org",
+                "contact_name": "Lakeside Racquet Club",
+                "contact_city": "Madison, WI",
+                "contact_address": "200 Shore Dr",
+                "contact_url": "www.lakesiderc.org",
+                "distance_to_harrogate_tn_miles": None,
+                "source_url": JOB_URL,
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
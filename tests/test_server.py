@@ -0,0 +1,195 @@
+import gzip
+import http.client
+import os
+import sys
+import threading
+import unittest
+from functools import partial
+from http.server import ThreadingHTTPServer
+from unittest import mock
+
+import orjson
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(TESTS_DIR), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import server  # noqa: E402
+
+
+def make_job(title, city, state, posted_date, score, summary=""):
+    return {
+        "job_title": title,
+        "location": {"city": city, "state": state},
+        "posted_date": posted_date,
+        "distance_to_harrogate_tn_miles": None,
+        "job_summary": summary,
+        "position_overview": "",
+        "suitability_score": score,
+        "how_to_apply": "",
+        "contact_name": "",
+        "source_url": f"https://example.com/{title.lower().replace(' ', '-')}",
+    }
+
+
+JOBS = [
+    make_job("Head Pro", "Austin", "Texas", "03 February 2026", 8, "Lead the junior academy"),
+    make_job("Assistant Pro", "Dallas", "Texas", "20 January 2026", 5, "Teach clinics"),
+    make_job("Pickleball Coach", "Naples", "Florida", "10 February 2026", None),
+    make_job("Tennis Director", "Lexington", "Kentucky", "", 9, "Run the club academy"),
+    make_job("Stringer", "Tampa", "Florida", "01 December 2025", 2),
+]
+
+
+def titles(jobs):
+    return [job["job_title"] for job in jobs]
+
+
+class FilterJobsTest(unittest.TestCase):
+    """filter_jobs through the position indexes, and through the unindexed fallback."""
+
+    def setUp(self):
+        jobs = list(JOBS)
+        search = server.index_search_fields(jobs)
+        patcher = mock.patch.multiple(
+            server,
+            SEARCH_FIELDS=search,
+            TRIGRAM_INDEX=server.index_trigrams(jobs, search[1]),
+            DATE_INDEX=server.index_posted_dates(jobs, search[1]),
+            SCORE_INDEX=server.index_scores(jobs),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.jobs = jobs
+
+    def check(self, query, expected):
+        query = {key: [value] for key, value in query.items()}
+        self.assertEqual(titles(server.filter_jobs(self.jobs, query)), expected)
+        # A different list object must not be answered from the indexes above.
+        self.assertEqual(titles(server.filter_jobs(list(self.jobs), query)), expected)
+
+    def test_no_filters_returns_everything(self):
+        self.check({}, titles(JOBS))
+
+    def test_text_query(self):
+        self.check({"q": "academy"}, ["Head Pro", "Tennis Director"])
+        self.check({"q": "PRO"}, ["Head Pro", "Assistant Pro"])
+        self.check({"q": "zz"}, [])
+
+    def test_location(self):
+        self.check({"location": "florida"}, ["Pickleball Coach", "Stringer"])
+
+    def test_date_range(self):
+        self.check({"posted_from": "2026-01-20"}, ["Head Pro", "Assistant Pro", "Pickleball Coach"])
+        self.check({"posted_to": "2026-01-20"}, ["Assistant Pro", "Stringer"])
+        self.check({"posted_from": "2026-02-01", "posted_to": "2026-02-05"}, ["Head Pro"])
+
+    def test_min_score(self):
+        self.check({"min_score": "8"}, ["Head Pro", "Tennis Director"])
+        self.check({"min_score": "x"}, titles(JOBS))
+
+    def test_combined(self):
+        self.check({"q": "pro", "min_score": "6", "location": "texas"}, ["Head Pro"])
+        self.check({"min_score": "5", "posted_from": "2026-01-01"}, ["Head Pro", "Assistant Pro"])
+
+    def test_stats(self):
+        expected = {
+            "total": 5,
+            "avgScore": "6.0",
+            "topState": "Texas",
+            "latestDate": "Feb 10, 2026",
+        }
+        self.assertEqual(server.compute_stats(self.jobs), expected)
+        self.assertEqual(server.compute_stats(list(self.jobs)), expected)
+
+
+class TTLCacheTest(unittest.TestCase):
+    def test_entries_expire(self):
+        cache = server.TTLCache(maxsize=4, ttl=10)
+        with mock.patch.object(server.time, "monotonic", return_value=100.0):
+            cache.put("a", 1)
+        with mock.patch.object(server.time, "monotonic", return_value=109.0):
+            self.assertEqual(cache.get("a"), 1)
+        with mock.patch.object(server.time, "monotonic", return_value=111.0):
+            self.assertIsNone(cache.get("a"))
+
+    def test_least_recently_used_is_evicted(self):
+        cache = server.TTLCache(maxsize=2, ttl=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+
+
+class CachedResponseTest(unittest.TestCase):
+    """ETag, 304 and gzip handling of the local server."""
+
+    @classmethod
+    def setUpClass(cls):
+        class QuietHandler(server.Handler):
+            def log_message(self, *args):
+                pass
+
+        handler = partial(QuietHandler, directory=server.WEB_DIR)
+        cls.httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=cls.httpd.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.httpd.shutdown()
+        cls.httpd.server_close()
+
+    def get(self, path, headers=None):
+        conn = http.client.HTTPConnection("127.0.0.1", self.httpd.server_port)
+        self.addCleanup(conn.close)
+        conn.request("GET", path, headers=headers or {})
+        response = conn.getresponse()
+        return response, response.read()
+
+    def test_cached_response_tuple(self):
+        body = b'{"jobs":[' + b'"x",' * 300 + b'"x"]}'
+        data, etag, gzipped = server.cached_response(body)
+        self.assertIs(data, body)
+        self.assertEqual(etag, server.make_etag(body))
+        self.assertEqual(gzip.decompress(gzipped), body)
+        self.assertIsNone(server.cached_response(b"{}")[2])
+
+    def test_matching_etag_gets_304(self):
+        path = "/api/jobs?limit=3"
+        response, body = self.get(path)
+        self.assertEqual(response.status, 200)
+        etag = response.getheader("ETag")
+        self.assertEqual(etag, server.make_etag(body))
+        response, body = self.get(path, {"If-None-Match": etag})
+        self.assertEqual(response.status, 304)
+        self.assertEqual(body, b"")
+        response, _ = self.get(path, {"If-None-Match": '"stale"'})
+        self.assertEqual(response.status, 200)
+
+    def test_gzip_variant_has_its_own_etag(self):
+        path = "/api/jobs?limit=3"
+        plain, plain_body = self.get(path)
+        response, body = self.get(path, {"Accept-Encoding": "gzip"})
+        self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+        self.assertEqual(gzip.decompress(body), plain_body)
+        etag = response.getheader("ETag")
+        self.assertEqual(etag, server.gzip_etag(plain.getheader("ETag")))
+        response, _ = self.get(path, {"Accept-Encoding": "gzip", "If-None-Match": etag})
+        self.assertEqual(response.status, 304)
+        # The gzip tag doesn't validate the identity representation.
+        response, _ = self.get(path, {"If-None-Match": etag})
+        self.assertEqual(response.status, 200)
+
+    def test_stats_round_trip(self):
+        response, body = self.get("/api/stats")
+        self.assertEqual(orjson.loads(body), server.STATS)
+        response, _ = self.get("/api/stats", {"If-None-Match": response.getheader("ETag")})
+        self.assertEqual(response.status, 304)
+
+
+if __name__ == "__main__":
+    unittest.main()